@@ -0,0 +1,44 @@
+"""Memory and time of loading a catalogue with and without an InternPool.
+
+Run with `python benchmarks/bench_intern_pool.py`.
+"""
+
+from __future__ import annotations
+
+import time
+import tracemalloc
+
+from corpus import make_corpus
+
+from lrctoolbox.intern_pool import InternPool
+from lrctoolbox.synced_lyrics import SyncedLyrics
+
+
+def measure(corpus: list[list[str]], pool: InternPool | None):
+    """peak-free resident size and time of the loaded documents"""
+    tracemalloc.start()
+    started = time.perf_counter()
+    loaded = [SyncedLyrics.load_from_lines(doc, pool) for doc in corpus]
+    elapsed = time.perf_counter() - started
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del loaded
+    return current, elapsed
+
+
+def main():
+    for n_documents in (100, 1_000, 3_000):
+        corpus = make_corpus(n_documents, chorus_every=4)
+        plain_bytes, plain_time = measure(corpus, None)
+        pool = InternPool()
+        pooled_bytes, pooled_time = measure(corpus, pool)
+        print(
+            f"{n_documents:>6} docs: str per line {plain_bytes / 1e6:7.2f} MB"
+            f" {plain_time:6.3f}s | pooled {pooled_bytes / 1e6:7.2f} MB"
+            f" {pooled_time:6.3f}s | saved {pool.bytes_saved / 1e6:.2f} MB"
+            f" ({pool.hits} hits, {len(pool)} pooled)"
+        )
+
+
+if __name__ == "__main__":
+    main()
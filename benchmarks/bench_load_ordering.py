@@ -0,0 +1,82 @@
+"""Ordering step of `load_from_lines` on chorus heavy lyrics.
+
+Compares the run merge used by `load_from_lines` with what it replaced:
+the `has_timestamps_all_equal` / `has_timestamps_in_ascending_order` scans
+and the full `sort(key=lambda x: x.timestamp or 0)`, on the same parsed
+lines. Run with `python benchmarks/bench_load_ordering.py`.
+"""
+
+from __future__ import annotations
+
+import timeit
+
+from corpus import make_corpus
+
+from lrctoolbox.synced_lyric_line import SyncedLyricLine
+from lrctoolbox._load_order import merge_runs, sort_key
+from lrctoolbox.synced_lyrics import SyncedLyrics
+
+
+def parse(document: list[str]):
+    """the parsed lines in both shapes: expanded and main + side run"""
+    expanded: list[SyncedLyricLine] = []
+    lines: list[SyncedLyricLine] = []
+    keys: list[int] = []
+    side_lines: list[SyncedLyricLine] = []
+    side_keys: list[int] = []
+    for line in document:
+        parsed = SyncedLyrics.parse_str(line)
+        if isinstance(parsed, dict):
+            continue
+        if isinstance(parsed, SyncedLyricLine):
+            parsed = [parsed]
+        head, *repeats = parsed
+        lines.append(head)
+        keys.append(sort_key(head.timestamp, len(expanded)))
+        expanded.append(head)
+        for repeat in repeats:
+            side_lines.append(repeat)
+            side_keys.append(sort_key(repeat.timestamp, len(expanded)))
+            expanded.append(repeat)
+    return expanded, (lines, keys, side_lines, side_keys, True)
+
+
+def previous_ordering(expanded: list[SyncedLyricLine]) -> None:
+    """the ordering done by `load_from_lines` before the run merge"""
+    lyrics = SyncedLyrics()
+    lyrics.synced_lines = list(expanded)
+    if lyrics.has_timestamps_all_equal:
+        for line in lyrics.synced_lines:
+            line.timestamp = None
+    if (
+        not lyrics.has_timestamps_in_ascending_order
+        and not lyrics.has_timestamps_all_equal
+    ):
+        lyrics.synced_lines.sort(key=lambda x: x.timestamp or 0)
+
+
+def main():
+    for n_lines, chorus_every in ((60, 0), (60, 4), (600, 4), (6000, 2)):
+        document = make_corpus(1, n_lines, chorus_every)[0]
+        expanded, runs = parse(document)
+        assert merge_runs(*runs) == sorted(
+            expanded, key=lambda x: x.timestamp or 0
+        )
+        number = max(20_000 // n_lines, 5)
+        previous = timeit.timeit(
+            lambda: previous_ordering(expanded), number=number
+        )
+        merge = timeit.timeit(lambda: merge_runs(*runs), number=number)
+        load = timeit.timeit(
+            lambda: SyncedLyrics.load_from_lines(document), number=number
+        )
+        print(
+            f"{n_lines:>5} lines, chorus every {chorus_every}:"
+            f" checks + sort {previous / number * 1e6:8.1f}us"
+            f" | run merge {merge / number * 1e6:8.1f}us"
+            f" | whole load {load / number * 1e6:9.1f}us"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""Memory per line and per document of loading, copying and saving lyrics.
+
+Measured with tracemalloc over corpora of growing size and compared with
+`SyncedLyrics.memory_usage`. Pass `--max-bytes-per-line N` to exit with an
+error when loading takes more than N bytes per line, to catch regressions.
+
+Run with `python benchmarks/bench_memory.py`.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+import tracemalloc
+from pathlib import Path
+from typing import Callable
+
+from corpus import make_corpus
+
+from lrctoolbox.synced_lyrics import SyncedLyrics
+
+
+def traced(func: Callable[[], object]) -> tuple[object, int, int]:
+    """result of `func` with the memory it kept and its peak"""
+    tracemalloc.start()
+    result = func()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, current, peak
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--max-bytes-per-line", type=float)
+    args = parser.parse_args(argv)
+
+    failed = False
+    for n_documents in (10, 100, 1_000):
+        corpus = make_corpus(n_documents, chorus_every=4)
+        loaded, load_bytes, _ = traced(
+            lambda: [SyncedLyrics.load_from_lines(doc) for doc in corpus]
+        )
+        n_lines = sum(len(lyrics.synced_lines) for lyrics in loaded)
+        estimate = sum(lyrics.memory_usage()["total"] for lyrics in loaded)
+        _, copy_bytes, _ = traced(lambda: [doc.copy() for doc in loaded])
+        with tempfile.TemporaryDirectory() as tmp:
+            _, _, save_peak = traced(
+                lambda: [
+                    doc.save_to_file(Path(tmp, f"{i}.lrc"))
+                    for i, doc in enumerate(loaded)
+                ]
+            )
+
+        per_line = load_bytes / n_lines
+        print(
+            f"{n_documents:>5} docs {n_lines:>6} lines |"
+            f" load {per_line:6.1f} B/line"
+            f" {load_bytes / n_documents:8.0f} B/doc"
+            f" (memory_usage {estimate / n_lines:6.1f} B/line) |"
+            f" copy {copy_bytes / n_documents:8.0f} B/doc |"
+            f" save peak {save_peak:8.0f} B"
+        )
+        if args.max_bytes_per_line and per_line > args.max_bytes_per_line:
+            failed = True
+
+    if failed:
+        print(
+            f"load uses more than {args.max_bytes_per_line} bytes per line",
+            file=sys.stderr,
+        )
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
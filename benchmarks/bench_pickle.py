@@ -0,0 +1,44 @@
+"""Size and speed of pickling loaded lyrics, as sent back by process pools.
+
+Run with `python benchmarks/bench_pickle.py`.
+"""
+
+from __future__ import annotations
+
+import pickle
+import time
+
+from corpus import make_corpus
+
+from lrctoolbox.synced_lyrics import SyncedLyrics
+
+
+def best_of(func, repeat: int = 5) -> float:
+    """fastest of `repeat` runs of `func` in seconds"""
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def main():
+    for n_lines in (60, 600):
+        corpus = make_corpus(1_000, n_lines=n_lines, chorus_every=4)
+        loaded = [SyncedLyrics.load_from_lines(doc) for doc in corpus]
+        # one pickle per document, like the results of `executor.map`
+        pickles = [pickle.dumps(doc) for doc in loaded]
+        size = sum(map(len, pickles))
+        dump_time = best_of(lambda: [pickle.dumps(doc) for doc in loaded])
+        load_time = best_of(lambda: [pickle.loads(data) for data in pickles])
+        print(
+            f"{len(loaded)} docs x {n_lines:>3} lines:"
+            f" {size / len(loaded):8.0f} B/doc |"
+            f" dumps {dump_time * 1e6 / len(loaded):7.1f} us/doc |"
+            f" loads {load_time * 1e6 / len(loaded):7.1f} us/doc"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""Synthetic LRC corpora shared by the benchmark scripts."""
+
+from __future__ import annotations
+
+import random
+
+ARTISTS = [f"Artist {i}" for i in range(50)]
+FILLERS = ["", "♪", "(instrumental)"]
+
+
+def make_document(
+    rng: random.Random, n_lines: int = 60, chorus_every: int = 0
+) -> list[str]:
+    """lines of one lrc document
+
+    `chorus_every`: every n-th line is a chorus line sung at several
+        timestamps like `[00:10.00][01:20.00]text`, 0 to disable
+    """
+    lines = [
+        f"[ar:{rng.choice(ARTISTS)}]",
+        f"[ti:Title {rng.randrange(10_000)}]",
+        f"[al:Album {rng.randrange(500)}]",
+        f"[length:{n_lines * 3 // 60:02d}:{n_lines * 3 % 60:02d}]",
+    ]
+    chorus = [f"Chorus line {i}" for i in range(4)]
+    for i in range(n_lines):
+        minutes, seconds = divmod(i * 3, 60)
+        timestamp = f"[{minutes:02d}:{seconds:02d}.{rng.randrange(100):02d}]"
+        if chorus_every and i % chorus_every == 0:
+            later = i * 3 + 90
+            timestamp += f"[{later // 60:02d}:{later % 60:02d}.00]"
+            text = rng.choice(chorus)
+        elif rng.random() < 0.2:
+            text = rng.choice(FILLERS)
+        else:
+            text = f"Verse line {rng.randrange(1_000_000)}"
+        lines.append(timestamp + text)
+    return lines
+
+
+def make_corpus(
+    n_documents: int, n_lines: int = 60, chorus_every: int = 0, seed=0
+) -> list[list[str]]:
+    """`n_documents` documents, reproducible for a given `seed`"""
+    rng = random.Random(seed)
+    return [
+        make_document(rng, n_lines, chorus_every) for _ in range(n_documents)
+    ]
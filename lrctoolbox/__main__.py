@@ -0,0 +1,7 @@
+"""Allow running the command line interface with `python -m lrctoolbox`."""
+
+import sys
+
+from lrctoolbox.cli import main
+
+sys.exit(main())
@@ -0,0 +1,91 @@
+"""Ordering the lines parsed by `SyncedLyrics.load_from_lines`."""
+
+from __future__ import annotations
+
+from typing import Iterable
+
+from lrctoolbox.synced_lyric_line import SyncedLyricLine
+
+
+def merge_runs(
+    lines: list[SyncedLyricLine],
+    keys: list[int],
+    side_lines: list[SyncedLyricLine],
+    side_keys: list[int],
+    in_order: bool,
+) -> list[SyncedLyricLine]:
+    """Order the lines parsed by `SyncedLyrics.load_from_lines`
+
+    `lines` is the main run, `side_lines` the extra timestamps of multi
+    timestamp lines. Each key packs the timestamp with the written position
+    (see `sort_key`), so sorting the keys gives what a stable sort of all
+    the lines in written order would.
+
+    When the main run is already `in_order` the keys are two sorted runs
+    (the side run is short) and timsort merges them in linear time instead
+    of sorting. The keys are sorted as ints, without a Python key function
+    call per line.
+    """
+    if in_order and not side_lines:
+        return lines
+    all_lines = lines + side_lines
+    all_keys = keys + side_keys
+    order = sorted(range(len(all_keys)), key=all_keys.__getitem__)
+    return list(map(all_lines.__getitem__, order))
+
+
+def track_runs(
+    parsed_lines: Iterable[list[SyncedLyricLine]],
+) -> tuple[
+    list[SyncedLyricLine],
+    list[int],
+    list[SyncedLyricLine],
+    list[int],
+    bool,
+    bool,
+]:
+    """Split the lines parsed by `SyncedLyrics.load_from_lines` into runs
+
+    each item of `parsed_lines` is a written line, with the repeats of a
+    multi timestamp line after it. Returns the main run and its keys, the
+    side run of the repeats and its keys (see `merge_runs`), whether the
+    main run is in order and whether all the timestamps are equal
+    """
+    main_run: list[SyncedLyricLine] = []
+    keys: list[int] = []
+    side_run: list[SyncedLyricLine] = []
+    side_keys: list[int] = []
+    # a line without timestamp takes the timestamp of the line before
+    # it for sorting, so it stays where it was written instead of being
+    # moved to the start
+    timestamp = -1
+    in_order = True
+    first_timestamp: int | None = None
+    all_equal = True
+
+    for parsed_line, *repeats in parsed_lines:
+        if not main_run:
+            first_timestamp = parsed_line.timestamp
+        elif parsed_line.timestamp != first_timestamp:
+            all_equal = False
+        if parsed_line.timestamp is not None:
+            if parsed_line.timestamp < timestamp:
+                in_order = False
+            timestamp = parsed_line.timestamp
+        position = len(main_run) + len(side_run)
+        main_run.append(parsed_line)
+        keys.append(sort_key(timestamp, position))
+
+        for repeat in repeats:
+            position += 1
+            if repeat.timestamp != first_timestamp:
+                all_equal = False
+            side_run.append(repeat)
+            side_keys.append(sort_key(repeat.timestamp, position))  # type: ignore # noqa: E501
+
+    return main_run, keys, side_run, side_keys, in_order, all_equal
+
+
+def sort_key(timestamp: int, position: int) -> int:
+    """timestamp first, written position to break ties"""
+    return timestamp << 32 | position
@@ -0,0 +1,33 @@
+"""Helpers to fan work over a stream of items out to an executor."""
+
+from __future__ import annotations
+
+from collections import deque
+from concurrent.futures import Executor, Future
+from typing import Callable, Iterable, Iterator, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def imap_bounded(
+    executor: Executor,
+    func: Callable[[T], R],
+    items: Iterable[T],
+    max_pending: int,
+) -> Iterator[R]:
+    """like `executor.map` but lazy
+
+    `executor.map` submits every item up front, which reads the whole
+    input into memory. Here at most `max_pending` items are in flight and
+    new ones are only pulled from `items` as results are consumed.
+
+    results are yielded in the same order as `items`
+    """
+    pending: deque[Future[R]] = deque()
+    for item in items:
+        pending.append(executor.submit(func, item))
+        if len(pending) >= max_pending:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
@@ -0,0 +1,351 @@
+"""Re-timing synced lyrics against a reference timeline.
+
+The reference is a list of times in milliseconds, e.g. the onsets found by
+an audio pipeline, a beat grid or the lines of an aligned transcript of
+another master of the same track.
+
+NumPy is used for the nearest neighbour searches when it is installed,
+the results are the same without it.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import functools
+from bisect import bisect_left, bisect_right
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Optional
+
+from lrctoolbox.synced_lyric_line import SyncedLyricLine
+
+if TYPE_CHECKING:
+    from lrctoolbox.synced_lyrics import SyncedLyrics
+
+FIT_ROUNDS = 3
+"""rounds of pairing lines with references and fitting them in
+`linear_fit`, each round pairs using the previous fit"""
+
+Nearest = Callable[[list[float]], list[float]]
+"""reference time nearest to each of the given times"""
+
+# matches of `align_dtw` as a linked list of
+# (line index, reference index, parent)
+_Path = Optional[tuple[int, int, Any]]
+
+
+@dataclasses.dataclass
+class AlignmentReport:
+    """How the timestamps were matched to the reference"""
+
+    method: str
+    residuals: list[float | None]
+    """for each line of the original lyrics, its timestamp minus the
+    reference time it was matched to: after the fit for `linear_fit`, before
+    snapping for the other methods. `None` for lines without timestamp or
+    not matched"""
+    unmatched: int = 0
+    """lines with a timestamp but no reference within `max_shift_ms`"""
+    scale: float = 1.0
+    """speed of the linear fit, `aligned = scale * timestamp + offset_ms`"""
+    offset_ms: float = 0.0
+    """offset of the linear fit"""
+
+    @property
+    def matched(self) -> int:
+        """number of lines matched to a reference time"""
+        return sum(residual is not None for residual in self.residuals)
+
+    @property
+    def mean_abs_error(self) -> float:
+        """mean of the absolute residuals in milliseconds"""
+        errors = [abs(res) for res in self.residuals if res is not None]
+        return sum(errors) / len(errors) if errors else 0.0
+
+    @property
+    def max_abs_error(self) -> float:
+        """largest absolute residual in milliseconds"""
+        errors = [abs(res) for res in self.residuals if res is not None]
+        return max(errors, default=0.0)
+
+
+@functools.cache
+def _numpy() -> Any:
+    """the numpy module, `None` if it is not installed
+
+    imported on first use rather than with `lrctoolbox`, importing it takes
+    longer than importing the rest of the package
+    """
+    try:
+        import numpy  # type: ignore[import-not-found] # pylint: disable=import-outside-toplevel # noqa: E501
+    except ImportError:  # pragma: no cover
+        return None
+    return numpy
+
+
+def nearest_function(reference: list[float]) -> Nearest:
+    """nearest neighbour search over the sorted, non empty `reference`"""
+    if len(reference) == 1:
+        return lambda times: reference * len(times)
+
+    np = _numpy()
+    if np is not None:
+        ref = np.asarray(reference, dtype=float)
+
+        def nearest_numpy(times: list[float]) -> list[float]:
+            values = np.asarray(times, dtype=float)
+            right = np.clip(np.searchsorted(ref, values), 1, len(ref) - 1)
+            left = ref[right - 1]
+            right_values = ref[right]
+            closest = np.where(
+                values - left <= right_values - values, left, right_values
+            )
+            return closest.tolist()
+
+        return nearest_numpy
+
+    def nearest_bisect(times: list[float]) -> list[float]:
+        closest = []
+        last = len(reference) - 1
+        for time in times:
+            right = min(max(bisect_left(reference, time), 1), last)
+            left = reference[right - 1]
+            if time - left <= reference[right] - time:
+                closest.append(left)
+            else:
+                closest.append(reference[right])
+        return closest
+
+    return nearest_bisect
+
+
+def _within(residual: float, max_shift_ms: float | None) -> bool:
+    return max_shift_ms is None or abs(residual) <= max_shift_ms
+
+
+def align_nearest(
+    times: list[float],
+    reference: list[float],
+    max_shift_ms: float | None,
+    report: AlignmentReport,
+) -> list[float]:
+    """snap every timestamp to the nearest reference time"""
+    aligned = []
+    for time, closest in zip(times, nearest_function(reference)(times)):
+        if _within(time - closest, max_shift_ms):
+            report.residuals.append(time - closest)
+            aligned.append(closest)
+        else:
+            report.residuals.append(None)
+            aligned.append(time)
+    return aligned
+
+
+def _least_squares(pairs: list[tuple[float, float]]) -> tuple[float, float]:
+    """scale and offset mapping the first values of `pairs` on the second"""
+    count = len(pairs)
+    sum_x = sum(x for x, _ in pairs)
+    sum_y = sum(y for _, y in pairs)
+    denominator = count * sum(x * x for x, _ in pairs) - sum_x * sum_x
+    if count < 2 or not denominator:
+        return 1.0, (sum_y - sum_x) / count
+    scale = (count * sum(x * y for x, y in pairs) - sum_x * sum_y) / (
+        denominator
+    )
+    return scale, (sum_y - scale * sum_x) / count
+
+
+def align_linear_fit(
+    times: list[float],
+    reference: list[float],
+    max_shift_ms: float | None,
+    report: AlignmentReport,
+) -> list[float]:
+    """stretch and shift all timestamps at once
+
+    fits `scale * timestamp + offset` to the nearest reference times by
+    least squares, ignoring pairs further apart than `max_shift_ms`. Fits
+    a constant offset and a drift between two masters of the same track.
+    """
+    nearest = nearest_function(reference)
+    scale, offset = 1.0, 0.0
+    for _ in range(FIT_ROUNDS):
+        predicted = [scale * time + offset for time in times]
+        pairs = [
+            (time, closest)
+            for time, fitted, closest in zip(
+                times, predicted, nearest(predicted)
+            )
+            if _within(fitted - closest, max_shift_ms)
+        ]
+        if not pairs:
+            break
+        scale, offset = _least_squares(pairs)
+
+    report.scale, report.offset_ms = scale, offset
+    aligned = [max(scale * time + offset, 0.0) for time in times]
+    for fitted, closest in zip(aligned, nearest(aligned)):
+        residual = fitted - closest
+        report.residuals.append(
+            residual if _within(residual, max_shift_ms) else None
+        )
+    return aligned
+
+
+def align_dtw(
+    times: list[float],
+    reference: list[float],
+    max_shift_ms: float | None,
+    report: AlignmentReport,
+) -> list[float]:
+    """match lines to reference times one to one, keeping their order
+
+    Dynamic time warping where every reference time is used at most once
+    and a line may stay unmatched at the cost of `max_shift_ms`. Unlike
+    `nearest`, two close lines are not snapped on the same reference.
+
+    Only the reference times within `max_shift_ms` of a line are tried, so
+    the cost grows with the density of the reference in that band rather
+    than with its length. Without `max_shift_ms` every pair is tried.
+    """
+    if max_shift_ms is None:
+        # skipping a line costs more than any match
+        gap = max(reference[-1] - times[0], times[-1] - reference[0], 0) + 1
+    else:
+        gap = max_shift_ms
+
+    # best alignment of the lines so far ending on reference index `j`,
+    # and the best one ending before the band of the current line
+    states: dict[int, tuple[float, _Path]] = {}
+    floor: tuple[float, _Path] = (0.0, None)
+
+    for i, time in enumerate(times):
+        if max_shift_ms is None:
+            low, high = 0, len(reference)
+        else:
+            low = bisect_left(reference, time - max_shift_ms)
+            high = bisect_right(reference, time + max_shift_ms)
+        states, floor = _dtw_band(
+            states,
+            floor,
+            (i, time),
+            range(low, high),
+            reference=reference,
+            gap=gap,
+        )
+
+    _, path = min([floor, *states.values()], key=_cost)
+    aligned = list(times)
+    residuals: list[float | None] = [None] * len(times)
+    while path is not None:
+        i, j, path = path
+        residuals[i] = times[i] - reference[j]
+        aligned[i] = reference[j]
+    report.residuals.extend(residuals)
+    return aligned
+
+
+def _dtw_band(
+    states: dict[int, tuple[float, _Path]],
+    floor: tuple[float, _Path],
+    line: tuple[int, float],
+    band: range,
+    *,
+    reference: list[float],
+    gap: float,
+) -> tuple[dict[int, tuple[float, _Path]], tuple[float, _Path]]:
+    """`states` and `floor` of `align_dtw` once `line` is matched
+
+    `line`: index and time of the line
+    `band`: indexes of the reference times the line may be matched with
+    """
+    i, time = line
+    # the bands only move forward, states before this one can not be
+    # matched against anymore
+    for j in [j for j in states if j < band.start]:
+        floor = min(floor, states.pop(j), key=_cost)
+
+    matched: dict[int, tuple[float, _Path]] = {}
+    best = floor
+    previous = sorted(states)
+    k = 0
+    for j in band:
+        while k < len(previous) and previous[k] < j:
+            best = min(best, states[previous[k]], key=_cost)
+            k += 1
+        matched[j] = (best[0] + abs(time - reference[j]), (i, j, best[1]))
+
+    # or leave this line unmatched
+    floor = (floor[0] + gap, floor[1])
+    for j, (cost, path) in states.items():
+        if j not in matched or cost + gap < matched[j][0]:
+            matched[j] = (cost + gap, path)
+    return matched, floor
+
+
+def _cost(state: tuple[float, object]) -> float:
+    return state[0]
+
+
+ALIGNERS: dict[
+    str,
+    Callable[
+        [list[float], list[float], float | None, AlignmentReport], list[float]
+    ],
+] = {
+    "nearest": align_nearest,
+    "linear_fit": align_linear_fit,
+    "dtw": align_dtw,
+}
+
+
+def align(
+    lyrics: SyncedLyrics,
+    reference_times: Iterable[float],
+    max_shift_ms: float | None = None,
+    method: str = "nearest",
+) -> tuple[SyncedLyrics, AlignmentReport]:
+    """see `SyncedLyrics.align_to`"""
+    reference = sorted(map(float, reference_times))
+    if not reference:
+        raise ValueError("reference_times is empty")
+    if method not in ALIGNERS:
+        raise ValueError(
+            f"unknown method {method!r}, expected one of {list(ALIGNERS)}"
+        )
+    lines = lyrics.synced_lines
+    timed = [i for i, line in enumerate(lines) if line.timestamp is not None]
+    if not timed:
+        raise ValueError("lyrics have no timestamps")
+    report = AlignmentReport(method, [])
+    aligned_times = ALIGNERS[method](
+        [lines[i].timestamp for i in timed],  # type: ignore
+        reference,
+        max_shift_ms,
+        report,
+    )
+
+    residuals: list[float | None] = [None] * len(lines)
+    new_lines = [SyncedLyricLine(line.text, line.timestamp) for line in lines]
+    for i, time, residual in zip(timed, aligned_times, report.residuals):
+        new_lines[i].timestamp = round(time)
+        residuals[i] = residual
+    report.residuals = residuals
+    report.unmatched = sum(residuals[i] is None for i in timed)
+
+    aligned = type(lyrics)()
+    aligned.update_metadata(lyrics.to_dict())
+    aligned.synced_lines = _sorted(new_lines)
+    return aligned, report
+
+
+def _sorted(lines: list[SyncedLyricLine]) -> list[SyncedLyricLine]:
+    """stable sort by timestamp, lines without one stay after the line
+    before them as when loading"""
+    keys = []
+    timestamp = -1
+    for line in lines:
+        if line.timestamp is not None:
+            timestamp = line.timestamp
+        keys.append(timestamp)
+    if all(a <= b for a, b in zip(keys, keys[1:])):
+        return lines
+    return [lines[i] for i in sorted(range(len(lines)), key=keys.__getitem__)]
@@ -0,0 +1,292 @@
+"""Command line interface to process directories of lyric files.
+
+Usage::
+
+    lrctoolbox normalize --collapse --jobs 4 ~/Music
+    lrctoolbox shift --ms -250 song.lrc
+    lrctoolbox convert --manifest done.txt ~/Lyrics
+    lrctoolbox validate --jobs 4 ~/Lyrics
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import functools
+import logging
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, Sequence
+
+from lrctoolbox import validation
+from lrctoolbox._parallel import imap_bounded
+from lrctoolbox.synced_lyrics import SyncedLyrics
+
+logger = logging.getLogger(__name__)
+
+Command = Callable[[Path, argparse.Namespace], "str | None"]
+
+
+def iter_lyric_files(
+    paths: Iterable[Path], suffixes: Sequence[str]
+) -> Iterator[Path]:
+    """yield lyric files under `paths` one at a time
+
+    directories are walked lazily so huge trees start processing right away
+    """
+    for path in paths:
+        if path.is_dir():
+            for root, dirs, files in os.walk(path):
+                dirs.sort()
+                for name in sorted(files):
+                    if os.path.splitext(name)[1] in suffixes:
+                        yield Path(root, name)
+        elif path.suffix in suffixes:
+            yield path
+        else:
+            logger.warning("Skipping %s: not a lyric file", path)
+
+
+def load_for_rewrite(path: Path) -> SyncedLyrics:
+    """load the file, failing if saving it again would lose timestamps
+
+    lyrics which are not synced are saved without timestamps, so a file
+    where only some lines have one, e.g. with a blank line between timed
+    lines, is refused rather than stripped
+    """
+    lyrics = SyncedLyrics.load_from_file(path)
+    if not lyrics.is_synced and any(
+        line.timestamp is not None for line in lyrics
+    ):
+        raise ValueError(
+            "lyrics have timestamps but are not synced, saving them would"
+            " drop the timestamps"
+        )
+    return lyrics
+
+
+def normalize(path: Path, args: argparse.Namespace) -> None:
+    """re-save the file in the canonical format"""
+    lyrics = load_for_rewrite(path)
+    lyrics.save_to_file(
+        path,
+        overwrite=True,
+        write_metadata=not args.no_metadata,
+        collapse_repeating_lyrics=args.collapse,
+        atomic=True,
+    )
+
+
+def shift(path: Path, args: argparse.Namespace) -> None:
+    """shift all the timestamps by `--ms` milliseconds"""
+    lyrics = load_for_rewrite(path)
+    for line in lyrics:
+        if line.timestamp is not None:
+            line.timestamp = max(line.timestamp + args.ms, 0)
+    lyrics.save_to_file(
+        path, overwrite=True, write_metadata=not args.no_metadata, atomic=True
+    )
+
+
+def validate(path: Path, args: argparse.Namespace) -> str | None:
+    """report the problems of the file, fail on errors"""
+    diagnostics = validation.validate(path, args.max_line_length)
+    errors = [
+        str(diagnostic)
+        for diagnostic in diagnostics
+        if diagnostic.severity is validation.Severity.ERROR
+    ]
+    if errors:
+        raise ValueError("; ".join(errors))
+    report = [f"{path}:{diagnostic}" for diagnostic in diagnostics]
+    return "\n".join(report) if report else None
+
+
+def stats(path: Path, _args: argparse.Namespace) -> str | None:
+    """line count and sync status of the file"""
+    lyrics = SyncedLyrics.load_from_file(path)
+    return f"{path}\t{len(lyrics.synced_lines)}\t{lyrics.is_synced}"
+
+
+def convert(path: Path, args: argparse.Namespace) -> None:
+    """convert a `.txt` file to `.lrc` next to it"""
+    lyrics = load_for_rewrite(path)
+    lyrics.save_to_file(
+        path.with_suffix(".lrc"),
+        overwrite=args.overwrite,
+        write_metadata=not args.no_metadata,
+        atomic=True,
+    )
+
+
+@dataclass
+class TaskResult:
+    """outcome of running a command on one file"""
+
+    path: Path
+    output: str | None = None
+    error: str | None = None
+
+
+def run_task(
+    path: Path, command: Command, args: argparse.Namespace
+) -> TaskResult:
+    """run a command on a file, catching errors so one bad file does not
+    stop the whole run"""
+    try:
+        return TaskResult(path, output=command(path, args))
+    except Exception as exc:  # pylint: disable=broad-except
+        return TaskResult(path, error=f"{type(exc).__name__}: {exc}")
+
+
+@dataclass
+class Summary:
+    """counters reported at the end of a run"""
+
+    processed: int = 0
+    skipped: int = 0
+    failures: list[TaskResult] = field(default_factory=list)
+    started: float = field(default_factory=time.perf_counter)
+
+    def report(self) -> str:
+        """human readable summary"""
+        elapsed = time.perf_counter() - self.started
+        rate = self.processed / elapsed if elapsed else 0.0
+        lines = [
+            f"processed {self.processed} files in {elapsed:.2f}s"
+            f" ({rate:.1f} files/s), {len(self.failures)} failed,"
+            f" {self.skipped} skipped from manifest"
+        ]
+        lines.extend(
+            f"FAILED {result.path}: {result.error}" for result in self.failures
+        )
+        return "\n".join(lines)
+
+
+COMMANDS: dict[str, tuple[Command, list[str]]] = {
+    "normalize": (normalize, SyncedLyrics.SUPPORTED_FILE_TYPES),
+    "shift": (shift, SyncedLyrics.SUPPORTED_FILE_TYPES),
+    "validate": (validate, SyncedLyrics.SUPPORTED_FILE_TYPES),
+    "stats": (stats, SyncedLyrics.SUPPORTED_FILE_TYPES),
+    "convert": (convert, [".txt"]),
+}
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """argument parser with one subcommand per entry in `COMMANDS`"""
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument(
+        "paths", nargs="+", type=Path, help="files or directories"
+    )
+    common.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="number of worker processes (default: %(default)s)",
+    )
+    common.add_argument(
+        "--manifest",
+        type=Path,
+        help="file recording finished paths, used to resume a run",
+    )
+
+    parser = argparse.ArgumentParser(
+        prog="lrctoolbox", description=__doc__.splitlines()[0]
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    for name, (func, _) in COMMANDS.items():
+        subparser = subparsers.add_parser(
+            name, parents=[common], help=func.__doc__
+        )
+        if name in ("normalize", "shift", "convert"):
+            subparser.add_argument(
+                "--no-metadata",
+                action="store_true",
+                help="do not write any metadata tags",
+            )
+
+    subparsers.choices["normalize"].add_argument(
+        "--collapse",
+        action="store_true",
+        help="collapse repeating lines into multi-timestamp lines",
+    )
+    subparsers.choices["shift"].add_argument(
+        "--ms", type=int, required=True, help="milliseconds to shift by"
+    )
+    subparsers.choices["convert"].add_argument(
+        "--overwrite", action="store_true", help="overwrite existing .lrc"
+    )
+    subparsers.choices["validate"].add_argument(
+        "--max-line-length",
+        type=int,
+        default=validation.MAX_LINE_LENGTH,
+        help="report longer lyric lines (default: %(default)s)",
+    )
+    return parser
+
+
+def read_manifest(path: Path | None) -> set[str]:
+    """paths already finished in a previous run"""
+    if path is None or not path.exists():
+        return set()
+    with open(path, "r", encoding="utf-8") as file:
+        return {line.rstrip("\n") for line in file if line.strip()}
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """entry point of the `lrctoolbox` console script"""
+    args = build_parser().parse_args(argv)
+    command, suffixes = COMMANDS[args.command]
+    done = read_manifest(args.manifest)
+    summary = Summary()
+
+    def pending_paths() -> Iterator[Path]:
+        for path in iter_lyric_files(args.paths, suffixes):
+            if str(path) in done:
+                summary.skipped += 1
+                continue
+            yield path
+
+    with contextlib.ExitStack() as stack:
+        manifest = (
+            stack.enter_context(open(args.manifest, "a", encoding="utf-8"))
+            if args.manifest
+            else None
+        )
+        if args.jobs > 1:
+            executor = stack.enter_context(
+                ProcessPoolExecutor(max_workers=args.jobs)
+            )
+            results = imap_bounded(
+                executor,
+                functools.partial(run_task, command=command, args=args),
+                pending_paths(),
+                max_pending=args.jobs * 4,
+            )
+        else:
+            results = (
+                run_task(path, command, args) for path in pending_paths()
+            )
+
+        for result in results:
+            summary.processed += 1
+            if result.error:
+                summary.failures.append(result)
+                continue
+            if result.output is not None:
+                print(result.output)
+            if manifest:
+                manifest.write(f"{result.path}\n")
+                manifest.flush()
+
+    print(summary.report(), file=sys.stderr)
+    return 1 if summary.failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
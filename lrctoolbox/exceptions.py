@@ -17,3 +17,17 @@ class FileTypeError(LRCError):
             f"File type {self.file_type} is not supported. "
             f"Supported file types are {self.supported_file_types}"
         )
+
+
+class FormatError(LRCError):
+    """Raised when the import or export format is not supported."""
+
+    def __init__(self, fmt: str, supported_formats: list[str]):
+        self.fmt = fmt
+        self.supported_formats = supported_formats
+
+    def __str__(self) -> str:
+        return (
+            f"Format {self.fmt} is not supported. "
+            f"Supported formats are {self.supported_formats}"
+        )
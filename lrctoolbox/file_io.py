@@ -0,0 +1,136 @@
+"""Writing lyric files safely, one at a time or in batches.
+
+`SyncedLyrics.save_to_file` and `SyncedLyrics.save_many` are built on these
+helpers. Files are written to a temporary file next to the destination and
+renamed over it, so a crash never leaves a half written file.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import dataclasses
+import io
+import logging
+import os
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, Any, Iterable, Iterator, TextIO
+
+from lrctoolbox._parallel import imap_bounded
+from lrctoolbox.exceptions import FileTypeError
+
+if TYPE_CHECKING:
+    from lrctoolbox.synced_lyrics import SyncedLyrics
+
+logger = logging.getLogger(__name__)
+
+
+@dataclasses.dataclass
+class SaveResult:
+    """outcome of saving one file with `SyncedLyrics.save_many`"""
+
+    path: Path
+    error: Exception | None = None
+
+    @property
+    def ok(self) -> bool:
+        """whether the file was saved"""
+        return self.error is None
+
+
+def check_save_path(
+    path: Path, supported_types: list[str], overwrite: bool
+) -> None:
+    """raise if lyrics can not be saved to `path`
+
+    `supported_types`: suffixes a lyric file may have
+    `overwrite`: whether an existing file may be replaced
+    """
+    exc: Exception | None = None
+
+    if path.suffix not in supported_types:
+        exc = FileTypeError(path.suffix, supported_types)
+
+    # make sure the file does not exist
+    if path.exists() and not overwrite:
+        exc = FileExistsError(
+            f"{path} already exists\nSet overwrite=True to overwrite"
+        )
+
+    if exc:
+        logger.exception(exc)
+        raise exc
+
+
+@contextlib.contextmanager
+def atomic_file(path: Path, fsync: bool = False) -> Iterator[TextIO]:
+    """a temporary text file renamed to `path` once written
+
+    `fsync`: flush the file to disk before it replaces `path`
+    """
+    tmp_path = path.with_name(f".{path.name}.{uuid.uuid4().hex[:8]}.tmp")
+    # `os.open` rather than `tempfile`, the file gets the usual permissions
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+    try:
+        with open(fd, "w", encoding="utf-8") as file:
+            yield file
+            if fsync:
+                file.flush()
+                os.fsync(file.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def is_binary(fileobj: IO[Any]) -> bool:
+    """whether `fileobj` takes `bytes` rather than `str`"""
+    if isinstance(fileobj, io.TextIOBase):
+        return False
+    if isinstance(fileobj, (io.RawIOBase, io.BufferedIOBase)):
+        return True
+    return "b" in getattr(fileobj, "mode", "")
+
+
+def is_file(maybe_path: str) -> bool:
+    """whether `maybe_path` exists, `False` if it can not be a path at all"""
+    try:
+        return Path(maybe_path).exists()
+    except (OSError, ValueError):
+        # e.g. lyrics longer than the maximum path length
+        return False
+
+
+def save_many(
+    items: Iterable[tuple[SyncedLyrics, Path | str]],
+    workers: int | None = None,
+    overwrite: bool = False,
+    fsync: bool = False,
+    **kwargs: Any,
+) -> list[SaveResult]:
+    """see `SyncedLyrics.save_many`"""
+    # the default of `ThreadPoolExecutor`, needed to bound pending work
+    workers = workers or min(32, (os.cpu_count() or 1) + 4)
+    created_dirs: set[Path] = set()
+
+    def save(item: tuple[SyncedLyrics, Path | str]) -> SaveResult:
+        synced_lyrics, path = item
+        path = Path(path)
+        try:
+            check_save_path(
+                path, synced_lyrics.SUPPORTED_FILE_TYPES, overwrite
+            )
+            if path.parent not in created_dirs:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                created_dirs.add(path.parent)
+            with atomic_file(path, fsync) as file:
+                synced_lyrics.write_to(file, **kwargs)
+        except Exception as exc:  # pylint: disable=broad-except
+            return SaveResult(path, exc)
+        return SaveResult(path)
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(
+            imap_bounded(executor, save, items, max_pending=workers * 4)
+        )
@@ -0,0 +1,208 @@
+"""Streaming readers and writers for LRC, SRT, WebVTT and JSON Lines.
+
+Writers go straight from the `SyncedLyricLine` records to the file object,
+one line or cue at a time. Readers consume the file object line by line.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from typing import TYPE_CHECKING, Callable, Iterable, Iterator, TextIO
+
+from lrctoolbox.lrc_metadata import TrackMetadata
+from lrctoolbox.synced_lyric_line import SyncedLyricLine
+
+if TYPE_CHECKING:
+    from lrctoolbox.synced_lyrics import SyncedLyrics
+
+DEFAULT_LAST_CUE_DURATION = 5000
+"""in milliseconds, used for the last cue when `length` is unknown"""
+
+cue_timing_pattern = re.compile(
+    r"(?:(\d+):)?(\d+):(\d+)[,.](\d+)\s*-->\s*(?:(\d+):)?(\d+):(\d+)[,.](\d+)"
+)
+length_pattern = re.compile(r"(?:(\d+):)?(\d+)(?:[.,](\d+))?")
+
+
+def parse_length(length: str | None) -> int | None:
+    """Parse the `length` metadata into milliseconds
+
+    `mm:ss`, `mm:ss.xx` and a number of seconds, `ss` or `ss.xx`, are
+    understood
+    """
+    if not length:
+        return None
+    match = length_pattern.fullmatch(length.strip())
+    if not match:
+        return None
+    minutes, seconds, fraction = match.groups()
+    fraction = (fraction or "0")[:3].ljust(3, "0")
+    return (int(minutes or 0) * 60 + int(seconds)) * 1000 + int(fraction)
+
+
+def iter_cues(
+    lines: Iterable[SyncedLyricLine], length: int | None = None
+) -> Iterator[tuple[int, int, str]]:
+    """Yield `(start, end, text)` for every timed line with text
+
+    a cue ends where the next timed line starts, the last one at `length`
+    """
+    start: int | None = None
+    text = ""
+    for line in lines:
+        if line.timestamp is None:
+            continue
+        if start is not None and text:
+            yield start, line.timestamp, text
+        start, text = line.timestamp, line.text
+
+    if start is not None and text:
+        end = (
+            length
+            if length is not None and length > start
+            else start + DEFAULT_LAST_CUE_DURATION
+        )
+        yield start, end, text
+
+
+def _format_cue_timestamp(timestamp: int, separator: str) -> str:
+    seconds, millis = divmod(timestamp, 1000)
+    minutes, seconds = divmod(seconds, 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours:02d}:{minutes:02d}:{seconds:02d}{separator}{millis:03d}"
+
+
+def write_lrc(lyrics: SyncedLyrics, fileobj: TextIO) -> None:
+    """write the lines of `SyncedLyrics.save_to_file`
+
+    the `re` and `ve` tags of the lyrics are kept, the ones of this package
+    are only written when they are not set
+    """
+    lyrics.write_to(fileobj, additional_metadata=TrackMetadata())
+
+
+def write_srt(lyrics: SyncedLyrics, fileobj: TextIO) -> None:
+    """write the timed lines as SubRip cues"""
+    cues = iter_cues(lyrics.synced_lines, parse_length(lyrics.length))
+    for index, (start, end, text) in enumerate(cues, start=1):
+        fileobj.write(
+            f"{index}\n{_format_cue_timestamp(start, ',')} -->"
+            f" {_format_cue_timestamp(end, ',')}\n{text}\n\n"
+        )
+
+
+def write_vtt(lyrics: SyncedLyrics, fileobj: TextIO) -> None:
+    """write the timed lines as WebVTT cues"""
+    fileobj.write("WEBVTT\n\n")
+    for start, end, text in iter_cues(
+        lyrics.synced_lines, parse_length(lyrics.length)
+    ):
+        fileobj.write(
+            f"{_format_cue_timestamp(start, '.')} -->"
+            f" {_format_cue_timestamp(end, '.')}\n{text}\n\n"
+        )
+
+
+def write_jsonl(lyrics: SyncedLyrics, fileobj: TextIO) -> None:
+    """write a metadata record followed by one record per line"""
+    metadata = lyrics.to_dict()
+    if metadata:
+        fileobj.write(json.dumps({"metadata": metadata}) + "\n")
+    for line in lyrics.synced_lines:
+        fileobj.write(
+            json.dumps({"timestamp": line.timestamp, "text": line.text}) + "\n"
+        )
+
+
+def _iter_cue_blocks(fileobj: TextIO) -> Iterator[tuple[int, int, str]]:
+    """Yield `(start, end, text)` from SRT or WebVTT cue blocks
+
+    blocks without a timing line (`WEBVTT` header, `NOTE`, ...) are skipped
+    """
+    timing: tuple[int, int] | None = None
+    text: list[str] = []
+    for raw_line in fileobj:
+        line = raw_line.strip()
+        if not line:
+            if timing is not None:
+                yield timing[0], timing[1], " ".join(text)
+            timing, text = None, []
+            continue
+        if timing is None:
+            match = re.search(cue_timing_pattern, line)
+            if match:
+                timing = _parse_cue_timing(match)
+            # anything before the timing line is a cue identifier
+            continue
+        text.append(line)
+
+    if timing is not None:
+        yield timing[0], timing[1], " ".join(text)
+
+
+def _parse_cue_timing(match: re.Match[str]) -> tuple[int, int]:
+    groups = [int(group or 0) for group in match.groups()]
+    start_h, start_m, start_s, start_ms, end_h, end_m, end_s, end_ms = groups
+    return (
+        ((start_h * 60 + start_m) * 60 + start_s) * 1000 + start_ms,
+        ((end_h * 60 + end_m) * 60 + end_s) * 1000 + end_ms,
+    )
+
+
+def _lines_from_cues(
+    cues: Iterable[tuple[int, int, str]],
+) -> list[SyncedLyricLine]:
+    """cues to lines, gaps between cues become empty lines"""
+    lines: list[SyncedLyricLine] = []
+    previous_end: int | None = None
+    for start, end, text in cues:
+        if previous_end is not None and previous_end < start:
+            lines.append(SyncedLyricLine("", previous_end))
+        lines.append(SyncedLyricLine(text, start))
+        previous_end = end
+    lines.sort(key=lambda x: x.timestamp or 0)
+    return lines
+
+
+def read_lrc(cls: type[SyncedLyrics], fileobj: TextIO) -> SyncedLyrics:
+    """read LRC, see `SyncedLyrics.load_from_lines`"""
+    return cls.load_from_lines([line.rstrip("\r\n") for line in fileobj])
+
+
+def read_subtitles(cls: type[SyncedLyrics], fileobj: TextIO) -> SyncedLyrics:
+    """read SRT or WebVTT cues"""
+    lyrics = cls()
+    lyrics.synced_lines = _lines_from_cues(_iter_cue_blocks(fileobj))
+    return lyrics
+
+
+def read_jsonl(cls: type[SyncedLyrics], fileobj: TextIO) -> SyncedLyrics:
+    """read records written by `write_jsonl`"""
+    lyrics = cls()
+    for raw_line in fileobj:
+        if not raw_line.strip():
+            continue
+        record = json.loads(raw_line)
+        if "metadata" in record:
+            lyrics.update_metadata(record["metadata"])
+            continue
+        lyrics.synced_lines.append(
+            SyncedLyricLine(record["text"], record.get("timestamp"))
+        )
+    return lyrics
+
+
+WRITERS: dict[str, Callable[[SyncedLyrics, TextIO], None]] = {
+    "lrc": write_lrc,
+    "srt": write_srt,
+    "vtt": write_vtt,
+    "jsonl": write_jsonl,
+}
+
+READERS: dict[str, Callable[[type[SyncedLyrics], TextIO], SyncedLyrics]] = {
+    "lrc": read_lrc,
+    "srt": read_subtitles,
+    "vtt": read_subtitles,
+    "jsonl": read_jsonl,
+}
@@ -0,0 +1,119 @@
+"""Immutable snapshots of synced lyrics, safe to share between threads."""
+
+from __future__ import annotations
+
+import dataclasses
+from typing import TYPE_CHECKING, Any, Iterator
+
+from lrctoolbox.lrc_metadata import LRCMetadata
+from lrctoolbox.synced_lyric_line import SyncedLyricLine, format_timestamp
+
+if TYPE_CHECKING:
+    from lrctoolbox.synced_lyrics import SyncedLyrics
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class FrozenSyncedLyricLine:
+    """An immutable, hashable `SyncedLyricLine`"""
+
+    text: str
+    timestamp: int | None = None
+    """in milliseconds"""
+
+    @property
+    def formatted_lyric(self) -> str:
+        """returns the formatted lyric with timestamp"""
+        if self.timestamp is None:
+            return self.text
+        return format_timestamp(self.timestamp) + self.text
+
+    def __str__(self) -> str:
+        return self.formatted_lyric
+
+    def thaw(self) -> SyncedLyricLine:
+        """a mutable copy"""
+        return SyncedLyricLine(self.text, self.timestamp)
+
+
+# no slots, setting a name which is not a field of a frozen slotted
+# dataclass raises a TypeError instead of FrozenInstanceError
+@dataclasses.dataclass(frozen=True)
+class FrozenSyncedLyrics:
+    """An immutable, hashable snapshot of `SyncedLyrics`
+
+    Made by `SyncedLyrics.freeze`. The lines are a tuple of frozen lines,
+    the metadata which is set a tuple of `(attribute, value)` pairs also
+    readable as attributes, e.g. `frozen.artist`, and the checks of the
+    lyrics are computed once. Nothing can change after creation, so one
+    snapshot can be read by many threads without locks or copies.
+    """
+
+    lines: tuple[FrozenSyncedLyricLine, ...]
+    metadata: tuple[tuple[str, Any], ...] = ()
+    is_synced: bool = dataclasses.field(default=False, compare=False)
+    has_timestamps_in_ascending_order: bool = dataclasses.field(
+        default=False, compare=False
+    )
+    has_timestamps_all_equal: bool = dataclasses.field(
+        default=False, compare=False
+    )
+    is_missing_any_timestamp: bool = dataclasses.field(
+        default=False, compare=False
+    )
+
+    @classmethod
+    def from_synced_lyrics(cls, lyrics: SyncedLyrics) -> FrozenSyncedLyrics:
+        """snapshot of `lyrics`, see `SyncedLyrics.freeze`"""
+        metadata = lyrics.to_dict()
+        return cls(
+            tuple(
+                FrozenSyncedLyricLine(line.text, line.timestamp)
+                for line in lyrics.synced_lines
+            ),
+            tuple(metadata.items()),
+            lyrics.is_synced,
+            lyrics.has_timestamps_in_ascending_order,
+            lyrics.has_timestamps_all_equal,
+            lyrics.is_missing_any_timestamp,
+        )
+
+    def __getattr__(self, name: str) -> Any:
+        # only called for names which are not attributes, i.e. metadata
+        for key, value in self.metadata:
+            if key == name:
+                return value
+        if name in LRCMetadata.LRC_FIELDS:
+            return None
+        raise AttributeError(
+            f"{type(self).__name__!r} object has no attribute {name!r}"
+        )
+
+    def __iter__(self) -> Iterator[FrozenSyncedLyricLine]:
+        return iter(self.lines)
+
+    def __len__(self) -> int:
+        return len(self.lines)
+
+    def __str__(self) -> str:
+        return "\n".join(self.lyrics)
+
+    @property
+    def lyrics(self) -> tuple[str, ...]:
+        """lyrics as strings with timestamp if synced, as in `SyncedLyrics`"""
+        if not self.is_synced:
+            return tuple(line.text for line in self.lines)
+        return tuple(line.formatted_lyric for line in self.lines)
+
+    def thaw(self) -> SyncedLyrics:
+        """a mutable copy, without parsing the lyrics again"""
+        # imported here as `synced_lyrics` imports this module
+        from lrctoolbox.synced_lyrics import (  # pylint: disable=import-outside-toplevel # noqa: E501
+            SyncedLyrics,
+        )
+
+        lyrics = SyncedLyrics()
+        lyrics.update_metadata(dict(self.metadata))
+        lyrics.synced_lines = [
+            SyncedLyricLine(line.text, line.timestamp) for line in self.lines
+        ]
+        return lyrics
@@ -0,0 +1,92 @@
+"""A pool to share equal strings between loaded lyrics."""
+
+from __future__ import annotations
+
+import sys
+from itertools import islice
+
+
+def _pool_only_refcount() -> int:
+    """refcount seen by `InternPool._sweep` for a string only the pool uses"""
+    probe = "".join(["lrctoolbox", "-probe"])  # a fresh, non interned str
+    pool = {probe: probe}
+    del probe
+    for key in pool:
+        return sys.getrefcount(key)
+    raise AssertionError("unreachable")
+
+
+_POOL_ONLY_REFCOUNT = (
+    _pool_only_refcount() if hasattr(sys, "getrefcount") else None
+)
+
+
+class InternPool:
+    """Deduplicates equal strings across `SyncedLyrics` documents
+
+    Lyrics are full of short repeated strings: empty lines, chorus lines,
+    "♪" and artist or album names shared by many files. Passing a pool to
+    `SyncedLyrics.load_from_lines` or `update_metadata` makes every equal
+    text point to a single `str` object.
+
+    At most `max_size` strings are kept. `str` can not be weakly referenced,
+    so when the pool is full it first drops the strings that no document
+    uses anymore (found by their reference count on CPython) and then the
+    oldest ones.
+    """
+
+    def __init__(self, max_size: int = 100_000):
+        self.max_size = max_size
+        self._pool: dict[str, str] = {}
+        self.hits = 0
+        """number of strings replaced by the pooled copy"""
+        self.misses = 0
+        """number of strings added to the pool"""
+        self.bytes_saved = 0
+        """size of the duplicate strings that were replaced"""
+
+    def __len__(self) -> int:
+        return len(self._pool)
+
+    def __contains__(self, value: str) -> bool:
+        return value in self._pool
+
+    def intern(self, value: str) -> str:
+        """return the pooled string equal to `value`, adding it if needed"""
+        pooled = self._pool.get(value)
+        if pooled is not None:
+            if pooled is not value:
+                self.hits += 1
+                self.bytes_saved += sys.getsizeof(value)
+            return pooled
+
+        self.misses += 1
+        self._pool[value] = value
+        if len(self._pool) > self.max_size:
+            self._evict()
+        return value
+
+    def clear(self) -> None:
+        """empty the pool, strings already handed out are not affected"""
+        self._pool.clear()
+
+    def _sweep(self) -> None:
+        """drop the strings which are only referenced by the pool"""
+        if _POOL_ONLY_REFCOUNT is None:
+            return
+        unused = [
+            key
+            for key in self._pool
+            if sys.getrefcount(key) <= _POOL_ONLY_REFCOUNT
+        ]
+        for key in unused:
+            del self._pool[key]
+
+    def _evict(self) -> None:
+        # make room for a tenth of the pool at once, so the O(n) sweep does
+        # not run on every insert of a full pool
+        target = self.max_size - self.max_size // 10
+        self._sweep()
+        oldest = list(islice(self._pool, max(len(self._pool) - target, 0)))
+        for key in oldest:
+            del self._pool[key]
@@ -1,30 +1,117 @@
 """A module that contains classes that represent LRC metadata."""
 
-from dataclasses import dataclass
+from __future__ import annotations
+
+import dataclasses
 import importlib.metadata
-from typing import ClassVar, Optional
+from dataclasses import dataclass
+from operator import attrgetter
+from typing import Any, Callable, ClassVar, Mapping, Optional, TypeVar
+
+MetadataT = TypeVar("MetadataT", bound="BaseLRCMetadata")
 
 
+def _values_getter(fields: tuple[str, ...]) -> Callable[[Any], tuple]:
+    """a function reading all `fields` of an object in one call"""
+    if len(fields) > 1:
+        return attrgetter(*fields)
+    if fields:
+        getter = attrgetter(fields[0])
+        return lambda obj: (getter(obj),)
+    return lambda obj: ()
+
+
+@dataclass()
 class BaseLRCMetadata:
-    """A class that represents base LRC metadata."""
+    """A class that represents base LRC metadata.
+
+    Subclasses map LRC tags to their fields in `LRC_METADATA_MAPPINGS`,
+    tags without a field are kept in `extra_tags` so that they are written
+    back as they were read.
+    """
+
+    __slots__ = ()
 
     LRC_METADATA_MAPPINGS: ClassVar[dict[str, str]] = {}
 
+    # precomputed from `LRC_METADATA_MAPPINGS` for every subclass
+    LRC_TAGS: ClassVar[tuple[str, ...]] = ()
+    """tags in the order they are written"""
+    LRC_FIELDS: ClassVar[tuple[str, ...]] = ()
+    """fields of `LRC_TAGS`, in the same order"""
+    FIELD_BY_KEY: ClassVar[dict[str, str]] = {}
+    """field of a tag or of a field name"""
+    _TAG_PREFIXES: ClassVar[tuple[str, ...]] = ()
+    _get_values: ClassVar[Callable[[Any], tuple]] = staticmethod(
+        _values_getter(())
+    )
+
+    extra_tags: dict[str, str] = dataclasses.field(default_factory=dict)
+    """tags which are not mapped to a field, by tag"""
+
+    def __init_subclass__(cls, **kwargs: Any):
+        super().__init_subclass__(**kwargs)
+        cls.LRC_TAGS = tuple(cls.LRC_METADATA_MAPPINGS)
+        cls.LRC_FIELDS = tuple(cls.LRC_METADATA_MAPPINGS.values())
+        cls.FIELD_BY_KEY = {
+            **{field: field for field in cls.LRC_FIELDS},
+            **cls.LRC_METADATA_MAPPINGS,
+        }
+        cls._TAG_PREFIXES = tuple(f"[{tag}:" for tag in cls.LRC_TAGS)
+        cls._get_values = staticmethod(_values_getter(cls.LRC_FIELDS))
+
     @property
     def lrc_formatted_metadata(self) -> list[str]:
         """Return a list of formatted metadata."""
         formatted_metadata = []
-        for key, value in self.LRC_METADATA_MAPPINGS.items():
-            if not getattr(self, value):
-                continue
-            formatted_metadata.append(f"[{key}:{getattr(self, value)}]")
+        values = type(self)._get_values(self)
+        for prefix, value in zip(self._TAG_PREFIXES, values):
+            if value:
+                formatted_metadata.append(f"{prefix}{value}]")
+        for tag, value in self.extra_tags.items():
+            if value:
+                formatted_metadata.append(f"[{tag}:{value}]")
         return formatted_metadata
 
+    @classmethod
+    def from_dict(
+        cls: type[MetadataT], metadata: Mapping[str, Any]
+    ) -> MetadataT:
+        """metadata from a mapping of tags or field names to values
+
+        keys which are neither go to `extra_tags`
+        """
+        fields: dict[str, Any] = {}
+        extra_tags: dict[str, Any] = {}
+        for key, value in metadata.items():
+            field = cls.FIELD_BY_KEY.get(key)
+            if field is None:
+                extra_tags[key] = value
+            else:
+                fields[field] = value
+        return cls(**fields, extra_tags=extra_tags)
+
+    def to_dict(self, by_tag: bool = False) -> dict[str, Any]:
+        """the metadata which is set, by field name or by tag
+
+        `extra_tags` are included by tag, `from_dict` reads the result back
+        """
+        keys = self.LRC_TAGS if by_tag else self.LRC_FIELDS
+        metadata = {
+            key: value
+            for key, value in zip(keys, type(self)._get_values(self))
+            if value is not None
+        }
+        metadata.update(self.extra_tags)
+        return metadata
+
 
 @dataclass()
 class TrackMetadataMixin:
     """A class that represents track metadata."""
 
+    __slots__ = ()
+
     artist: Optional[str] = None
     title: Optional[str] = None
     album: Optional[str] = None
@@ -50,6 +137,8 @@ class TrackMetadataMixin:
 class ModuleMetadataMixin:
     """A class that represents module metadata."""
 
+    __slots__ = ()
+
     re_name: Optional[str] = None
     version: Optional[str] = None
     author: Optional[str] = None
@@ -61,7 +150,10 @@ class ModuleMetadataMixin:
     }
 
 
-class LRCMetadata(BaseLRCMetadata, TrackMetadataMixin, ModuleMetadataMixin):
+# the mixins are listed after the base so that its `extra_tags` field comes
+# last, and the track fields first as the positional arguments
+@dataclass(slots=True)
+class LRCMetadata(BaseLRCMetadata, ModuleMetadataMixin, TrackMetadataMixin):
     """A class that represents combined metadata of module and track."""
 
     LRC_METADATA_MAPPINGS = {
@@ -70,12 +162,14 @@ class LRCMetadata(BaseLRCMetadata, TrackMetadataMixin, ModuleMetadataMixin):
     }
 
 
+@dataclass(slots=True)
 class TrackMetadata(BaseLRCMetadata, TrackMetadataMixin):
     """A class that represents track metadata."""
 
     LRC_METADATA_MAPPINGS = TrackMetadataMixin.LRC_METADATA_MAPPINGS
 
 
+@dataclass(slots=True, init=False)
 class ModuleMetadata(BaseLRCMetadata, ModuleMetadataMixin):
     """A class that represents module metadata."""
 
@@ -86,6 +180,7 @@ class ModuleMetadata(BaseLRCMetadata, ModuleMetadataMixin):
         re_name: Optional[str] = None,
         version: Optional[str] = None,
         author: Optional[str] = None,
+        extra_tags: Optional[dict[str, str]] = None,
     ):
         """Initialize a new instance of ModuleMetadata."""
         if all(attr is None for attr in (re_name, version)):
@@ -93,4 +188,8 @@ class ModuleMetadata(BaseLRCMetadata, ModuleMetadataMixin):
             re_name = __name__.split(".", 1)[0]
             metadata = importlib.metadata.metadata(re_name)
             version = metadata["Version"]
-        super().__init__(re_name, version, author)
+        # not `super()`, `dataclass(slots=True)` replaces the class
+        BaseLRCMetadata.__init__(
+            self, {} if extra_tags is None else extra_tags
+        )
+        ModuleMetadataMixin.__init__(self, re_name, version, author)
@@ -0,0 +1,264 @@
+"""Real time playback of synced lyrics with asyncio.
+
+Usage::
+
+    async for line in lyrics.play():
+        await websocket.send(line.text)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import math
+import time
+import weakref
+from bisect import bisect_right
+from typing import Callable, Iterable
+
+from lrctoolbox.synced_lyric_line import SyncedLyricLine
+
+Clock = Callable[[], float]
+"""monotonic clock in seconds, like `time.monotonic`"""
+
+
+class PlaybackScheduler:
+    """Wakes up playback sessions at their deadlines
+
+    All the sessions sharing a scheduler are kept in one heap and served by
+    a single event loop timer armed for the earliest deadline, instead of
+    one sleeping task per session or per line.
+
+    Deadlines are in `clock` time. The event loop timer is only a hint: when
+    it fires the clock is read again and anything not yet due is re-armed,
+    so a clock drifting from the loop's own is followed. Deadlines within
+    `resolution` seconds are considered due, which bounds the re-arming.
+
+    Futures resolved early, e.g. by a seek, are dropped from the heap once
+    they make up half of it, so seeking many sessions does not grow it.
+    """
+
+    def __init__(
+        self, clock: Clock = time.monotonic, resolution: float = 0.001
+    ):
+        self.clock = clock
+        self.resolution = resolution
+        self._heap: list[tuple[float, int, asyncio.Future[None]]] = []
+        # the futures of the heap which are not resolved yet
+        self._pending: set[asyncio.Future[None]] = set()
+        self._counter = itertools.count()
+        self._timer: asyncio.TimerHandle | None = None
+        self._timer_deadline = math.inf
+
+    def __len__(self) -> int:
+        """number of pending deadlines"""
+        return len(self._pending)
+
+    def wait_until(self, deadline: float) -> asyncio.Future[None]:
+        """a future resolved once `clock()` reaches `deadline`
+
+        resolving or cancelling the future early is allowed, the scheduler
+        then drops it
+        """
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[None] = loop.create_future()
+        heapq.heappush(self._heap, (deadline, next(self._counter), future))
+        self._pending.add(future)
+        future.add_done_callback(self._forget)
+        if deadline < self._timer_deadline:
+            self._arm(loop)
+        return future
+
+    def _arm(self, loop: asyncio.AbstractEventLoop) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+        self._timer_deadline = self._heap[0][0]
+        self._timer = loop.call_later(
+            max(self._timer_deadline - self.clock(), self.resolution),
+            self._fire,
+            loop,
+        )
+
+    def _fire(self, loop: asyncio.AbstractEventLoop) -> None:
+        self._timer = None
+        self._timer_deadline = math.inf
+        now = self.clock() + self.resolution
+        while self._heap and (
+            self._heap[0][0] <= now or self._heap[0][2].done()
+        ):
+            _, _, future = heapq.heappop(self._heap)
+            self._pending.discard(future)
+            if not future.done():
+                future.set_result(None)
+        if self._heap:
+            self._arm(loop)
+
+    def _forget(self, future: asyncio.Future[None]) -> None:
+        """done callback of the futures, only acts on the ones resolved
+        before their deadline, which are still in the heap"""
+        if future not in self._pending:
+            return
+        self._pending.discard(future)
+        if 2 * len(self._pending) > len(self._heap):
+            return
+        self._heap = [entry for entry in self._heap if not entry[2].done()]
+        heapq.heapify(self._heap)
+        if not self._heap and self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+            self._timer_deadline = math.inf
+
+
+_default_schedulers: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, PlaybackScheduler
+] = weakref.WeakKeyDictionary()
+
+
+def default_scheduler() -> PlaybackScheduler:
+    """the scheduler shared by all playbacks on the running event loop"""
+    loop = asyncio.get_running_loop()
+    if loop not in _default_schedulers:
+        _default_schedulers[loop] = PlaybackScheduler()
+    return _default_schedulers[loop]
+
+
+class Playback:
+    """Async iterator yielding lines when their timestamp is reached
+
+    The position is computed from the last anchor (clock time and position
+    at the last start, seek, pause or rate change) rather than by adding up
+    sleeps, so lateness of one line never shifts the following ones.
+
+    Lines without timestamp are skipped.
+    """
+
+    def __init__(
+        self,
+        lines: Iterable[SyncedLyricLine],
+        clock: Clock | None = None,
+        position_ms: int = 0,
+        rate: float = 1.0,
+        scheduler: PlaybackScheduler | None = None,
+    ):
+        """`clock`: defaults to the clock of `scheduler`, which defaults to
+        the scheduler shared on the running loop. A `clock` other than the
+        one of `scheduler` can not be given, the deadlines are in the time
+        of the scheduler"""
+        if rate <= 0:
+            raise ValueError(f"rate must be positive, got {rate}")
+        if (
+            clock is not None
+            and scheduler is not None
+            and clock is not scheduler.clock
+        ):
+            raise ValueError(
+                "clock is not the clock of scheduler, pass only one of them"
+            )
+        if scheduler is None and clock is not None:
+            scheduler = PlaybackScheduler(clock)
+        self._scheduler = scheduler
+        self.clock: Clock = (
+            time.monotonic if scheduler is None else scheduler.clock
+        )
+        self._lines = [line for line in lines if line.timestamp is not None]
+        self._timestamps: list[int] = [line.timestamp for line in self._lines]  # type: ignore # noqa: E501
+        self._rate = rate
+        self._paused = False
+        self._anchor_clock = self.clock()
+        self._anchor_position: float = position_ms
+        self._index = self._index_at(position_ms)
+        self._wakeup: asyncio.Future[None] | None = None
+        self.lag_ms = 0.0
+        """how late the last line was yielded"""
+
+    def __aiter__(self) -> Playback:
+        return self
+
+    async def __anext__(self) -> SyncedLyricLine:
+        while True:
+            if self._index >= len(self._lines):
+                raise StopAsyncIteration
+
+            if self._paused:
+                self._wakeup = asyncio.get_running_loop().create_future()
+                await self._wakeup
+                continue
+
+            if self._scheduler is None:
+                self._scheduler = default_scheduler()
+            deadline = self._clock_at(self._timestamps[self._index])
+            now = self.clock()
+            if deadline > now + self._scheduler.resolution:
+                self._wakeup = self._scheduler.wait_until(deadline)
+                await self._wakeup
+                continue
+
+            self.lag_ms = max(now - deadline, 0) * 1000
+            self._index += 1
+            return self._lines[self._index - 1]
+
+    @property
+    def position(self) -> float:
+        """current position in milliseconds"""
+        if self._paused:
+            return self._anchor_position
+        elapsed = self.clock() - self._anchor_clock
+        return self._anchor_position + elapsed * 1000 * self._rate
+
+    @property
+    def paused(self) -> bool:
+        """whether the playback is paused"""
+        return self._paused
+
+    @property
+    def rate(self) -> float:
+        """playback speed, 1.0 is real time"""
+        return self._rate
+
+    @rate.setter
+    def rate(self, rate: float) -> None:
+        if rate <= 0:
+            raise ValueError(f"rate must be positive, got {rate}")
+        self._reanchor(self.position)
+        self._rate = rate
+        self._interrupt()
+
+    def seek(self, position_ms: float) -> None:
+        """jump to `position_ms`, the line sung there is yielded next"""
+        self._reanchor(position_ms)
+        self._index = self._index_at(position_ms)
+        self._interrupt()
+
+    def pause(self) -> None:
+        """stop the clock of this playback"""
+        if self._paused:
+            return
+        self._reanchor(self.position)
+        self._paused = True
+        self._interrupt()
+
+    def resume(self) -> None:
+        """restart the clock from where it was paused"""
+        if not self._paused:
+            return
+        self._paused = False
+        self._reanchor(self._anchor_position)
+        self._interrupt()
+
+    def _index_at(self, position_ms: float) -> int:
+        # the line active at `position_ms`, or the first one
+        return max(bisect_right(self._timestamps, position_ms) - 1, 0)
+
+    def _clock_at(self, position_ms: int) -> float:
+        delta = (position_ms - self._anchor_position) / 1000 / self._rate
+        return self._anchor_clock + delta
+
+    def _reanchor(self, position_ms: float) -> None:
+        self._anchor_clock = self.clock()
+        self._anchor_position = position_ms
+
+    def _interrupt(self) -> None:
+        """wake `__anext__` up to recompute its deadline"""
+        if self._wakeup is not None and not self._wakeup.done():
+            self._wakeup.set_result(None)
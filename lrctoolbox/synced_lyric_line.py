@@ -20,14 +20,21 @@ class SyncedLyricLine:
     def __str__(self) -> str:
         return self.formatted_lyric
 
+    def __reduce__(self):
+        # the arguments rather than the `__dict__`, smaller and faster
+        return type(self), (self.text, self.timestamp)
+
     @property
     def _formatted_timestamp(self) -> str:
         """returns the formatted timestamp"""
         if self.timestamp is None:
             return ""
+        return format_timestamp(self.timestamp)
+
 
-        timestamp = datetime.utcfromtimestamp(self.timestamp // 1000).replace(
-            microsecond=self.timestamp % 1000 * 1000
-        )
-        timestamp_str = "[" + f"{timestamp:%M:%S.%f}"[:-4] + "]"
-        return timestamp_str
+def format_timestamp(timestamp: int) -> str:
+    """format milliseconds as a lrc timestamp like `[03:20.11]`"""
+    formatted = datetime.utcfromtimestamp(timestamp // 1000).replace(
+        microsecond=timestamp % 1000 * 1000
+    )
+    return "[" + f"{formatted:%M:%S.%f}"[:-4] + "]"
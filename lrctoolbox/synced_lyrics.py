@@ -2,18 +2,46 @@
 
 from __future__ import annotations
 
+import concurrent.futures
+import dataclasses
+import functools
+import io
 import logging
 import re
-from pathlib import Path
-from typing import Any, ClassVar, Iterator
+import struct
+import sys
+import zipfile
+from array import array
+from itertools import accumulate
+from pathlib import Path, PurePosixPath
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    ClassVar,
+    Iterable,
+    Iterator,
+    TextIO,
+    cast,
+)
 
-from lrctoolbox.exceptions import FileTypeError
+from lrctoolbox import alignment, file_io, formats
+from lrctoolbox._load_order import merge_runs, track_runs
+from lrctoolbox._parallel import imap_bounded
+from lrctoolbox.exceptions import FileTypeError, FormatError
+from lrctoolbox.frozen_synced_lyrics import FrozenSyncedLyrics
+from lrctoolbox.intern_pool import InternPool
 from lrctoolbox.lrc_metadata import (
     BaseLRCMetadata,
     LRCMetadata,
     ModuleMetadata,
 )
 from lrctoolbox.synced_lyric_line import SyncedLyricLine
+from lrctoolbox.synced_lyrics_window import SyncedLyricsWindow
+
+if TYPE_CHECKING:
+    from lrctoolbox.playback import Clock, Playback, PlaybackScheduler
 
 logger = logging.getLogger(__name__)
 
@@ -29,9 +57,14 @@ def parse_timestamps(timestamps: str) -> Iterator[int]:
     """Parse the timestamps from the string"""
 
     for a_match in re.finditer(timestamp_parsing_pattern, timestamps):
-        ms_ = int(a_match.group(3))
-        # make sure the ms is 3 digits
-        ms_ = ms_ * 10 ** (3 - len(str(ms_)))
+        fraction = a_match.group(3)
+        if len(fraction) > 3:
+            # an int as for shorter ones, the lines are sorted as ints
+            ms_ = int(fraction[:3])
+        else:
+            # make sure the ms is 3 digits
+            ms_ = int(fraction)
+            ms_ = ms_ * 10 ** (3 - len(str(ms_)))
         timestamp_in_ms = (
             int(a_match.group(1)) * 60 * 1000
             + int(a_match.group(2)) * 1000
@@ -61,9 +94,30 @@ def collapse_repeating_lines(
     return collapsed_lines[::-1]
 
 
-class SyncedLyrics(LRCMetadata):
+def _pack_ints(values: list[int]) -> array:
+    """`values` in the smallest signed array type which holds them"""
+    low, high = min(values, default=0), max(values, default=0)
+    for typecode in "bhi":
+        bits = array(typecode).itemsize * 8 - 1
+        if -(1 << bits) <= low and high < 1 << bits:
+            return array(typecode, values)
+    return array("q", values)
+
+
+# size of a `SyncedLyricLine` with one pointer per attribute, looking at the
+# `__dict__` of every line would allocate one where the values are inline
+_LINE_SIZE = sys.getsizeof(SyncedLyricLine("")) + (
+    struct.calcsize("P") * len(dataclasses.fields(SyncedLyricLine))
+)
+
+
+# the loaders and writers are the API of the class, their work is done in
+# `formats`, `file_io`, `alignment` and `playback`
+class SyncedLyrics(LRCMetadata):  # pylint: disable=too-many-public-methods
     """A class that represents synced lyrics."""
 
+    __slots__ = ("_synced_lines",)
+
     SUPPORTED_FILE_TYPES: ClassVar[list[str]] = [".lrc", ".txt"]
 
     def __init__(self):
@@ -71,11 +125,43 @@ class SyncedLyrics(LRCMetadata):
         self._synced_lines: list[SyncedLyricLine] = []
 
     def __str__(self) -> str:
-        return "\n".join(self.lyrics)
+        return "\n".join(self.iter_lrc(write_metadata=False))
 
     def __iter__(self):
         return iter(self.synced_lines)
 
+    def __getstate__(self) -> dict[str, Any]:
+        """packed state for pickling
+
+        the lines are stored as an array of timestamps, with the positions
+        of the `None` ones in another array, and the texts joined in one
+        string with an array of their lengths, instead of one object per
+        line. Only the metadata which is set is kept.
+        """
+        lines = self._synced_lines
+        texts = [line.text for line in lines]
+        untimed = [
+            index for index, line in enumerate(lines) if line.timestamp is None
+        ]
+        return {
+            "metadata": self.to_dict(),
+            "timestamps": _pack_ints([line.timestamp or 0 for line in lines]),
+            "untimed": _pack_ints(untimed),
+            "lengths": _pack_ints(list(map(len, texts))),
+            "text": "".join(texts),
+        }
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        SyncedLyrics.__init__(self)
+        self.update_metadata(state["metadata"])
+        text = state["text"]
+        ends = list(accumulate(state["lengths"]))
+        texts = [text[start:end] for start, end in zip([0] + ends, ends)]
+        timestamps: list[int | None] = state["timestamps"].tolist()
+        for index in state["untimed"]:
+            timestamps[index] = None
+        self._synced_lines = list(map(SyncedLyricLine, texts, timestamps))
+
     @property
     def synced_lines(self) -> list[SyncedLyricLine]:
         """returns the lines as a list of SyncedLyricLine objects"""
@@ -158,6 +244,47 @@ class SyncedLyrics(LRCMetadata):
         """Check if any timestamp is None"""
         return any(line.timestamp is None for line in self._synced_lines)
 
+    def window(
+        self, start_ms: int, end_ms: int, include_active: bool = False
+    ) -> SyncedLyricsWindow:
+        """read-only view of the lines from `start_ms` up to `end_ms`
+
+        the view references the lines of these lyrics, finding its bounds
+        costs O(log n) and nothing is copied. See `SyncedLyricsWindow`.
+        """
+        return SyncedLyricsWindow(
+            self._synced_lines, start_ms, end_ms, include_active
+        )
+
+    def play(
+        self,
+        clock: Clock | None = None,
+        position_ms: int = 0,
+        rate: float = 1.0,
+        scheduler: PlaybackScheduler | None = None,
+    ) -> Playback:
+        """async iterator yielding the lines as they are sung
+
+        `clock`: monotonic clock in seconds, defaults to the clock of
+            `scheduler` or `time.monotonic`. It can not differ from the
+            clock of `scheduler`
+        `position_ms`: where to start, the line sung there comes first
+        `rate`: playback speed, 1.0 is real time
+        `scheduler`: share one timer between many playbacks, by default the
+            playbacks on an event loop share one
+
+        The returned `Playback` can `seek`, `pause`, `resume` and change its
+        `rate` while being iterated.
+        """
+        # imported here, asyncio is only needed for playback
+        from lrctoolbox.playback import (  # pylint: disable=import-outside-toplevel # noqa: E501
+            Playback,
+        )
+
+        return Playback(
+            self._synced_lines, clock, position_ms, rate, scheduler
+        )
+
     @classmethod
     def parse_str(
         cls, line: str
@@ -197,9 +324,18 @@ class SyncedLyrics(LRCMetadata):
         return SyncedLyricLine(line.strip())
 
     @classmethod
-    def load_from_lines(cls, lines: list[str]) -> SyncedLyrics:
+    def load_from_lines(
+        cls, lines: list[str], intern_pool: InternPool | None = None
+    ) -> SyncedLyrics:
         """
         Load synced lyrics from a list of strings.
+
+        The lines are ordered by timestamp, a line without timestamp stays
+        after the line it was written after. If all the timestamps are the
+        same they are removed.
+
+        `intern_pool`: share line texts and metadata values with other
+            documents loaded using the same pool, see `InternPool`
         """
 
         logger.debug("Loading synced lyrics from lines")
@@ -226,37 +362,59 @@ class SyncedLyrics(LRCMetadata):
         # use regex to match the metadata and synced lyrics
         synced_lyrics = cls()
 
-        for line in lines:
-            parsed_line = cls.parse_str(line)
-            if isinstance(parsed_line, SyncedLyricLine):
-                synced_lyrics._synced_lines.append(parsed_line)
-                continue
-            if isinstance(parsed_line, list):
-                synced_lyrics._synced_lines.extend(parsed_line)
-                continue
-            synced_lyrics.update_metadata(parsed_line)
-
-        if synced_lyrics.has_timestamps_all_equal:
-            # set all timestamp to None
+        def parse() -> Iterator[list[SyncedLyricLine]]:
+            for line in lines:
+                parsed_line = cls.parse_str(line)
+                if isinstance(parsed_line, dict):
+                    synced_lyrics.update_metadata(parsed_line, intern_pool)
+                    continue
+                if not isinstance(parsed_line, list):
+                    parsed_line = [parsed_line]
+                if intern_pool is not None:
+                    text = intern_pool.intern(parsed_line[0].text)
+                    for repeat in parsed_line:
+                        repeat.text = text
+                yield parsed_line
+
+        main_run, keys, side_run, side_keys, in_order, all_equal = track_runs(
+            parse()
+        )
+        synced_lyrics._synced_lines = merge_runs(
+            main_run, keys, side_run, side_keys, in_order
+        )
+        if all_equal:
+            # set all timestamp to None, the lines stay in written order
             for _line in synced_lyrics._synced_lines:
                 _line.timestamp = None
-
-        if (
-            not synced_lyrics.has_timestamps_in_ascending_order
-            and not synced_lyrics.has_timestamps_all_equal
-        ):
-            synced_lyrics._synced_lines.sort(key=lambda x: x.timestamp or 0)
         return synced_lyrics
 
     @classmethod
-    def load_from_file(cls, path: Path | str):
+    def load_from_file(
+        cls, path: Path | str, intern_pool: InternPool | None = None
+    ):
         """convenience method to load from a file
 
         `path`: Path to the lrc file
+        `intern_pool`: see `load_from_lines`
 
         calls `load_from_lines` internally after reading the file
         """
 
+        path = cls._resolve_path(path)
+
+        with open(path, "r", encoding="utf-8") as file:
+            lines = file.readlines()
+
+        if not lines:
+            exc = ValueError(f"{path} is empty")
+            logger.exception(exc)
+            raise exc
+        return cls.load_from_lines(lines, intern_pool)
+
+    @classmethod
+    def _resolve_path(cls, path: Path | str) -> Path:
+        """find the lrc file to read, trying the supported extensions"""
+
         path = Path(path)
 
         # make sure the file exists and is lrc file
@@ -278,44 +436,437 @@ class SyncedLyrics(LRCMetadata):
                 )
                 logger.exception(exc)
                 raise exc
+        return path
 
-        with open(path, "r", encoding="utf-8") as file:
-            lines = file.readlines()
+    @classmethod
+    def _parse_tag(cls, line: str) -> dict[str, str] | None:
+        """Parse a line for lrc metadata only, `None` if it is a lyric"""
+        # same precedence as `parse_str`
+        match = re.search(lyricist_pattern, line)
+        if match:
+            return {"lyricist": match.group(1).strip()}
+        if re.search(synced_lyrics_pattern, line):
+            return None
+        match = re.search(metadata_pattern, line)
+        if match:
+            key, value = match.groups()
+            key = cls.LRC_METADATA_MAPPINGS.get(key, key)
+            return {key: value.strip()}
+        return None
+
+    @classmethod
+    def scan_metadata(
+        cls,
+        path: Path | str,
+        max_bytes: int | None = 64 * 1024,
+        full_scan_fallback: bool = True,
+    ) -> LRCMetadata:
+        """read only the metadata of a lrc file
+
+        `path`: Path to the lrc file
+        `max_bytes`: stop reading the header after this many bytes,
+            `None` to read the whole header
+        `full_scan_fallback`: after the header, look for tags in the rest of
+            the file (some files put them at the end). As when loading, a
+            later tag replaces the same tag of the header
+
+        The header ends at the first lyric line, lyric lines are never
+        parsed into `SyncedLyricLine` objects and nothing is sorted, so this
+        is a fraction of the cost of `load_from_file` when only tags are
+        needed. Scanning the rest of the file costs more than the header,
+        but still less than loading it.
+        """
+
+        path = cls._resolve_path(path)
+        metadata: dict[str, str] = {}
+        header_over = False
+        bytes_read = 0
+
+        with open(path, "rb") as file:
+            for raw_line in file:
+                bytes_read += len(raw_line)
+                line = raw_line.decode("utf-8")
+                tag = cls._parse_tag(line)
+                if tag is None:
+                    if not line.strip():
+                        continue
+                    # first lyric line, the header is over
+                    header_over = True
+                    break
+                metadata.update(tag)
+                if max_bytes is not None and bytes_read >= max_bytes:
+                    break
+
+            if header_over and full_scan_fallback:
+                logger.debug("Scanning the rest of %s for tags", path)
+                for raw_line in file:
+                    metadata.update(
+                        cls._parse_tag(raw_line.decode("utf-8")) or {}
+                    )
+
+        return LRCMetadata.from_dict(metadata)
+
+    @classmethod
+    def scan_metadata_many(
+        cls,
+        paths: Iterable[Path | str],
+        workers: int | None = None,
+        **kwargs: Any,
+    ) -> list[LRCMetadata]:
+        """`scan_metadata` for many files using a pool of threads
+
+        `paths`: Paths to the lrc files
+        `workers`: number of threads, defaults to the executor's default
+        `kwargs`: passed on to `scan_metadata`
+
+        results are returned in the same order as `paths`
+        """
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=workers
+        ) as executor:
+            return list(
+                executor.map(
+                    functools.partial(cls.scan_metadata, **kwargs), paths
+                )
+            )
+
+    @classmethod
+    def load_from_bytes(
+        cls,
+        data: bytes,
+        encoding: str = "utf-8-sig",
+        intern_pool: InternPool | None = None,
+    ) -> SyncedLyrics:
+        """Load synced lyrics from the content of a lrc file
+
+        `data`: encoded lines, e.g. the body of a HTTP response
+        `encoding`: the default also drops a leading byte order mark
+        `intern_pool`: see `load_from_lines`
+        """
+        if not data:
+            exc = ValueError("data is empty")
+            logger.exception(exc)
+            raise exc
+        return cls.load_from_binary_io(io.BytesIO(data), encoding, intern_pool)
+
+    @classmethod
+    def load_from_binary_io(
+        cls,
+        stream: IO[bytes],
+        encoding: str = "utf-8-sig",
+        intern_pool: InternPool | None = None,
+    ) -> SyncedLyrics:
+        """Load synced lyrics from a binary stream
+
+        `stream`: file object opened in binary mode, a zip member, ...
+        `encoding`: the default also drops a leading byte order mark
+        `intern_pool`: see `load_from_lines`
+
+        lines are split as in `load_from_file`, the stream is left open
+        """
+        wrapper = io.TextIOWrapper(stream, encoding=encoding)
+        try:
+            lines = wrapper.readlines()
+        finally:
+            # so closing the wrapper does not close the stream
+            wrapper.detach()
 
         if not lines:
-            exc = ValueError(f"{path} is empty")
+            exc = ValueError("stream is empty")
             logger.exception(exc)
             raise exc
-        return cls.load_from_lines(lines)
+        return cls.load_from_lines(lines, intern_pool)
+
+    @classmethod
+    def iter_archive(
+        cls,
+        zip_path: Path | str | IO[bytes],
+        workers: int | None = None,
+        encoding: str = "utf-8-sig",
+    ) -> Iterator[tuple[str, SyncedLyrics]]:
+        """Load the lyrics files of a zip archive without extracting it
+
+        `zip_path`: path or binary file object of the archive
+        `workers`: parse the members in that many processes, by default
+            they are parsed one after another in this process
+        `encoding`: encoding of the members
+
+        yields `(member name, synced lyrics)` in archive order for the
+        members with a supported file type
+        """
+        with zipfile.ZipFile(zip_path) as archive:
+            members = [
+                info.filename
+                for info in archive.infolist()
+                if not info.is_dir()
+                and PurePosixPath(info.filename).suffix
+                in cls.SUPPORTED_FILE_TYPES
+            ]
+
+            if not workers or workers <= 1:
+                for name in members:
+                    with archive.open(name) as member:
+                        yield name, cls.load_from_binary_io(member, encoding)
+                return
+
+            # members are read here, only the parsing is sent to processes
+            load = functools.partial(cls.load_from_bytes, encoding=encoding)
+            # `concurrent.futures` only imports its process pool, which
+            # takes longer than importing this package, once it is used
+            with concurrent.futures.ProcessPoolExecutor(
+                max_workers=workers
+            ) as executor:
+                yield from zip(
+                    members,
+                    imap_bounded(
+                        executor,
+                        load,
+                        map(archive.read, members),
+                        max_pending=workers * 4,
+                    ),
+                )
 
     @classmethod
-    def load(cls, maybe_lyrics: Any):  # TODO: fix type
-        """Load synced lyrics from a object"""
+    def load(
+        cls, maybe_lyrics: Any, is_content: bool = False
+    ):  # TODO: fix type
+        """Load synced lyrics from a object
+
+        `maybe_lyrics`: lines, the path of a lrc file, its content as `str`
+            or `bytes`
+        `is_content`: a `str` is the content of a lrc file, otherwise it is
+            first looked up as a path on the filesystem
+        """
 
         if isinstance(maybe_lyrics, list):
             return cls.load_from_lines(maybe_lyrics)
         if isinstance(maybe_lyrics, Path):
             return cls.load_from_file(maybe_lyrics)
+        if isinstance(maybe_lyrics, (bytes, bytearray, memoryview)):
+            return cls.load_from_bytes(bytes(maybe_lyrics))
         if isinstance(maybe_lyrics, str):
-            if Path(maybe_lyrics).exists():
+            if not is_content and file_io.is_file(maybe_lyrics):
                 return cls.load_from_file(maybe_lyrics)
             return cls.load_from_lines(maybe_lyrics.splitlines())
 
-        exc = TypeError("maybe_lyrics must be a list, str or Path")
+        exc = TypeError("maybe_lyrics must be a list, str, bytes or Path")
         logger.exception(exc)
         raise exc
 
-    def update_metadata(self, metadata: dict[str, str]) -> SyncedLyrics:
-        """updates the metadata of the synced lyrics"""
+    @classmethod
+    def load_from_stream(
+        cls, fileobj: TextIO, fmt: str = "lrc"
+    ) -> SyncedLyrics:
+        """Load synced lyrics from a text stream
+
+        `fileobj`: text file object, read line by line
+        `fmt`: one of `lrc`, `srt`, `vtt` or `jsonl`
+
+        gaps between subtitle cues become empty lines so that the end of a
+        cue is kept when exporting again
+        """
+        if fmt not in formats.READERS:
+            exc = FormatError(fmt, list(formats.READERS))
+            logger.exception(exc)
+            raise exc
+        return formats.READERS[fmt](cls, fileobj)
+
+    def export(self, fmt: str, fileobj: TextIO) -> None:
+        """write the synced lyrics to a text stream
+
+        `fmt`: one of `lrc`, `srt`, `vtt` or `jsonl`
+        `fileobj`: text file object, written line by line
+
+        for subtitles a cue lasts until the next timestamp, the last one
+        until the `length` metadata. Lines without timestamp or text are
+        not written as cues.
+        """
+        if fmt not in formats.WRITERS:
+            exc = FormatError(fmt, list(formats.WRITERS))
+            logger.exception(exc)
+            raise exc
+        formats.WRITERS[fmt](self, fileobj)
+
+    def freeze(self) -> FrozenSyncedLyrics:
+        """an immutable, hashable snapshot of the lyrics
+
+        reading it needs no locks and no defensive copies, see
+        `FrozenSyncedLyrics`. `FrozenSyncedLyrics.thaw` makes a mutable copy
+        again, both without formatting and parsing the lyrics like `copy`
+        """
+        return FrozenSyncedLyrics.from_synced_lyrics(self)
+
+    def align_to(
+        self,
+        reference_times: Iterable[float],
+        max_shift_ms: float | None = None,
+        method: str = "nearest",
+    ) -> tuple[SyncedLyrics, alignment.AlignmentReport]:
+        """re-time the lyrics against a reference timeline
+
+        `reference_times`: times in milliseconds, e.g. onsets found in the
+            audio or the line timestamps of another master of the track
+        `max_shift_ms`: lines further than that from any reference time
+            are left as they are, unlimited by default
+        `method`:
+            - `nearest`: snap each timestamp to the nearest reference time
+            - `linear_fit`: shift and stretch all timestamps by the line
+              fitting them best to the reference, for an offset or a drift
+            - `dtw`: match lines to reference times one to one in order,
+              for elastic differences
+            see `lrctoolbox.alignment`
+
+        lines without timestamp are kept after the line before them
+
+        returns the aligned copy and a report of the residual errors
+        """
+        return alignment.align(self, reference_times, max_shift_ms, method)
+
+    def update_metadata(
+        self,
+        metadata: dict[str, str],
+        intern_pool: InternPool | None = None,
+    ) -> SyncedLyrics:
+        """updates the metadata of the synced lyrics
+
+        `metadata`: values by tag or field name, other keys are kept in
+            `extra_tags`
+        `intern_pool`: share the values with other documents using the pool
+        """
+        field_by_key = self.FIELD_BY_KEY
         for key, value in metadata.items():
-            key = self.LRC_METADATA_MAPPINGS.get(key, key)
-            setattr(self, key, value)
+            if intern_pool is not None and isinstance(value, str):
+                value = intern_pool.intern(value)
+            field = field_by_key.get(key)
+            if field is None:
+                self.extra_tags[key] = value
+            else:
+                setattr(self, field, value)
 
         return self
 
+    def memory_usage(self, deep: bool = True) -> dict[str, int]:
+        """approximate memory used by the synced lyrics in bytes
+
+        `deep`: also count the strings and ints referenced by the lines and
+            the metadata, otherwise only the objects holding them
+
+        returns a breakdown with keys:
+            - `lines`: the line list and the `SyncedLyricLine` objects,
+              with their timestamps if `deep`
+            - `text`: the line texts, a string shared by several lines is
+              counted once
+            - `metadata`: this object and its metadata values
+            - `total`: the sum of the above
+
+        sizes are as reported by `sys.getsizeof`, which does not include
+        the overhead of the allocator
+        """
+        lines = (
+            sys.getsizeof(self._synced_lines)
+            + len(self._synced_lines) * _LINE_SIZE
+        )
+        text = 0
+        metadata = sys.getsizeof(self) + sys.getsizeof(self.extra_tags)
+
+        if deep:
+            seen_texts: set[int] = set()
+            for line in self._synced_lines:
+                if line.timestamp is not None:
+                    lines += sys.getsizeof(line.timestamp)
+                if id(line.text) not in seen_texts:
+                    seen_texts.add(id(line.text))
+                    text += sys.getsizeof(line.text)
+            metadata += sum(map(sys.getsizeof, self.to_dict().values()))
+            metadata += sum(map(sys.getsizeof, self.extra_tags))
+
+        return {
+            "lines": lines,
+            "text": text,
+            "metadata": metadata,
+            "total": lines + text + metadata,
+        }
+
     def copy(self) -> SyncedLyrics:
         """returns a copy of the synced lyrics"""
-        return self.load_from_lines(self.lrc_formatted_metadata + self.lyrics)
+        # not by formatting and parsing again, which drops the timestamps
+        # of lyrics that are not synced
+        lyrics = type(self)()
+        lyrics.update_metadata(self.to_dict())
+        lyrics.synced_lines = [
+            SyncedLyricLine(line.text, line.timestamp)
+            for line in self._synced_lines
+        ]
+        return lyrics
+
+    def iter_lrc(
+        self,
+        write_metadata: bool = True,
+        additional_metadata: BaseLRCMetadata | None = None,
+        collapse_repeating_lyrics: bool = False,
+    ) -> Iterator[str]:
+        """yield the lines written by `save_to_file`, one at a time
+
+        the arguments are as in `save_to_file`. Only the metadata lines and,
+        with `collapse_repeating_lyrics`, the collapsed lines are built
+        upfront, the lyrics are formatted as they are consumed.
+        """
+        if write_metadata:
+            yield from self._metadata_to_save(additional_metadata)
+
+        synced = self.is_synced
+        lines = self._synced_lines
+        if collapse_repeating_lyrics and synced:
+            lines = collapse_repeating_lines(lines)
+        if not synced:
+            for line in lines:
+                yield line.text
+            return
+        for line in lines:
+            yield line.formatted_lyric
+
+    def write_to(
+        self,
+        fileobj: IO[str] | IO[bytes],
+        buffer_size: int = 64 * 1024,
+        encoding: str = "utf-8",
+        **kwargs: Any,
+    ) -> None:
+        """write the lrc lines to a text or binary stream in chunks
+
+        `fileobj`: file, socket file, compressor, ... Text is encoded with
+            `encoding` for binary streams
+        `buffer_size`: approximate number of characters per `write` call
+        `kwargs`: `write_metadata`, `additional_metadata` and
+            `collapse_repeating_lyrics` as in `save_to_file`
+
+        lines are separated by newlines without one after the last, as in
+        `save_to_file`. Memory used does not grow with the lyrics.
+        """
+        write: Callable[[str], object]
+        if file_io.is_binary(fileobj):
+            binary = cast(IO[bytes], fileobj)
+
+            def write(text: str) -> None:
+                binary.write(text.encode(encoding))
+
+        else:
+            write = cast(IO[str], fileobj).write
+
+        chunk: list[str] = []
+        size = 0
+        separator = ""
+        for line in self.iter_lrc(**kwargs):
+            chunk.append(separator)
+            chunk.append(line)
+            separator = "\n"
+            size += len(line) + 1
+            if size >= buffer_size:
+                write("".join(chunk))
+                chunk.clear()
+                size = 0
+        if chunk:
+            write("".join(chunk))
 
     def save_to_file(
         self,
@@ -324,49 +875,72 @@ class SyncedLyrics(LRCMetadata):
         write_metadata: bool = True,
         additional_metadata: BaseLRCMetadata | None = None,
         collapse_repeating_lyrics: bool = False,
+        *,
+        atomic: bool = False,
     ):
-        """save the synced lyrics to a file"""
-        path = Path(path)
-        exc: Exception | None = None
-
-        if path.suffix not in self.SUPPORTED_FILE_TYPES:
-            exc = FileTypeError(path.suffix, self.SUPPORTED_FILE_TYPES)
+        """save the synced lyrics to a file
 
-        # make sure the file does not exist
-        if path.exists() and not overwrite:
-            exc = FileExistsError(
-                f"{path} already exists\nSet overwrite=True to overwrite"
-            )
-
-        if exc:
-            logger.exception(exc)
-            raise exc
-
-        copy = self.copy()
-        if collapse_repeating_lyrics and copy.is_synced:
-            copy.synced_lines = collapse_repeating_lines(copy.synced_lines)
-
-        # update the metadata
-        if write_metadata:
-            additional_metadata = additional_metadata or ModuleMetadata()
-            copy.update_metadata(
-                {
-                    k: v
-                    for k, v in additional_metadata.__dict__.items()
-                    if v is not None
-                }
-            )
-            # make sure re_name and version is not None
-            copy.re_name = copy.re_name or ModuleMetadata().re_name
-            copy.version = copy.version or ModuleMetadata().version
+        `atomic`: write a temporary file next to `path` and rename it to
+            `path` once written, so a crash never leaves `path` half
+            written
+        """
+        path = Path(path)
+        file_io.check_save_path(path, self.SUPPORTED_FILE_TYPES, overwrite)
 
         if not path.parent.exists():
             path.parent.mkdir(parents=True)
 
-        lines_to_write = (
-            copy.lrc_formatted_metadata + copy.lyrics
-            if write_metadata
-            else copy.lyrics
-        )
-        with open(path, "w", encoding="utf-8") as file:
-            file.write("\n".join(lines_to_write))
+        with (
+            file_io.atomic_file(path)
+            if atomic
+            else open(path, "w", encoding="utf-8")
+        ) as file:
+            self.write_to(
+                file,
+                write_metadata=write_metadata,
+                additional_metadata=additional_metadata,
+                collapse_repeating_lyrics=collapse_repeating_lyrics,
+            )
+
+    @classmethod
+    def save_many(
+        cls,
+        items: Iterable[tuple[SyncedLyrics, Path | str]],
+        workers: int | None = None,
+        overwrite: bool = False,
+        fsync: bool = False,
+        **kwargs: Any,
+    ) -> list[file_io.SaveResult]:
+        """save many synced lyrics to files using a pool of threads
+
+        `items`: `(synced_lyrics, path)` pairs, consumed lazily
+        `workers`: number of threads, defaults to the executor's default
+        `overwrite`: as in `save_to_file`
+        `fsync`: flush each file to disk before it replaces the destination
+        `kwargs`: `write_metadata`, `additional_metadata` and
+            `collapse_repeating_lyrics` as in `save_to_file`
+
+        Each file is written to a temporary file next to it which is then
+        renamed over the destination, so an interrupted batch never leaves
+        truncated files. Errors do not stop the batch, they are reported in
+        the `SaveResult` of the file, in the order of `items`.
+        """
+        return file_io.save_many(items, workers, overwrite, fsync, **kwargs)
+
+    def _metadata_to_save(
+        self, additional_metadata: BaseLRCMetadata | None = None
+    ) -> list[str]:
+        """the metadata lines written by `save_to_file`"""
+        values = self.to_dict()
+        values.update((additional_metadata or _module_metadata()).to_dict())
+        metadata = LRCMetadata.from_dict(values)
+        # make sure re_name and version is not None
+        metadata.re_name = metadata.re_name or _module_metadata().re_name
+        metadata.version = metadata.version or _module_metadata().version
+        return metadata.lrc_formatted_metadata
+
+
+@functools.cache
+def _module_metadata() -> ModuleMetadata:
+    """metadata of this package, reading it is slow enough to cache"""
+    return ModuleMetadata()
@@ -0,0 +1,118 @@
+"""Read-only view of the synced lyrics between two timestamps."""
+
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from itertools import islice
+from typing import Iterator, Sequence
+
+from lrctoolbox.synced_lyric_line import SyncedLyricLine, format_timestamp
+
+
+class _SortKeys(Sequence[int]):
+    """the keys the lines are sorted by when loading, computed lazily
+
+    a line without timestamp takes the timestamp of the timed line before
+    it, -1 if there is none, as it stays after that line when loading
+    """
+
+    def __init__(self, lines: list[SyncedLyricLine]):
+        self._lines = lines
+
+    def __len__(self) -> int:
+        return len(self._lines)
+
+    def __getitem__(self, index):
+        # only called by `bisect` with an int, walks back over the lines
+        # without timestamp, which are usually few in a row
+        while index >= 0:
+            timestamp = self._lines[index].timestamp
+            if timestamp is not None:
+                return timestamp
+            index -= 1
+        return -1
+
+
+class SyncedLyricsWindow:
+    """A read-only view of the lines from `start_ms` up to `end_ms`
+
+    The view keeps a reference to the lines of the parent `SyncedLyrics`
+    and the bounds found by bisecting them, nothing is copied. The parent
+    lines must be sorted (as they are after loading) and the view is stale
+    once the parent lines are replaced or reordered.
+
+    A line without timestamp belongs to the timed line before it, it is in
+    the window when that line is.
+    """
+
+    def __init__(
+        self,
+        lines: list[SyncedLyricLine],
+        start_ms: int,
+        end_ms: int,
+        include_active: bool = False,
+    ):
+        """`include_active`: also include the line that is still being sung
+        at `start_ms`, i.e. the last line starting before it"""
+        self._lines = lines
+        self.start_ms = start_ms
+        self.end_ms = end_ms
+        keys = _SortKeys(lines)
+        self._start = bisect_left(keys, start_ms)
+        self._stop = max(
+            bisect_left(keys, end_ms, lo=self._start), self._start
+        )
+        if include_active:
+            active = self._last_timed(self._start, 0)
+            if active is not None:
+                self._start = active
+
+    def __len__(self) -> int:
+        return self._stop - self._start
+
+    def __iter__(self) -> Iterator[SyncedLyricLine]:
+        return islice(self._lines, self._start, self._stop)
+
+    def __getitem__(self, index: int) -> SyncedLyricLine:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("window index out of range")
+        return self._lines[self._start + index]
+
+    def __str__(self) -> str:
+        return "\n".join(self.iter_lrc())
+
+    @property
+    def lyrics(self) -> list[str]:
+        """lyrics in the window as a list of strings with timestamp"""
+        return list(self.iter_lrc())
+
+    def line_at(self, timestamp: int) -> SyncedLyricLine | None:
+        """the line being sung at `timestamp`, `None` outside the window"""
+        if not self.start_ms <= timestamp < self.end_ms:
+            return None
+        index = bisect_right(
+            _SortKeys(self._lines), timestamp, self._start, self._stop
+        )
+        active = self._last_timed(index, self._start)
+        return None if active is None else self._lines[active]
+
+    def _last_timed(self, stop: int, start: int) -> int | None:
+        """index of the last line with timestamp before `stop`"""
+        for index in range(stop - 1, start - 1, -1):
+            if self._lines[index].timestamp is not None:
+                return index
+        return None
+
+    def iter_lrc(self, rebase: bool = False) -> Iterator[str]:
+        """yield the formatted lines of the window
+
+        `rebase`: make the timestamps relative to the window start
+        """
+        offset = self.start_ms if rebase else 0
+        for line in self:
+            if line.timestamp is None:
+                yield line.text
+                continue
+            yield format_timestamp(max(line.timestamp - offset, 0)) + line.text
@@ -0,0 +1,288 @@
+"""Checking lyric files for problems before publishing them.
+
+`validate` reads the raw lines once, without loading them into
+`SyncedLyrics`, so it sees what loading hides: the lines out of order that
+are sorted, the equal timestamps that are removed, the tags that have no
+field. Each problem is a `Diagnostic` pointing at its line::
+
+    for diagnostic in validate("song.lrc"):
+        print(diagnostic)
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import enum
+import functools
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Iterable, Iterator, Optional
+
+from lrctoolbox._parallel import imap_bounded
+from lrctoolbox.exceptions import FileTypeError
+from lrctoolbox.formats import parse_length
+from lrctoolbox.lrc_metadata import LRCMetadata
+from lrctoolbox.synced_lyric_line import SyncedLyricLine, format_timestamp
+from lrctoolbox.synced_lyrics import SyncedLyrics
+
+MAX_LINE_LENGTH = 120
+"""lyric lines longer than this many characters are reported"""
+
+
+class Severity(str, enum.Enum):
+    """how bad a problem is, `ERROR` fails the `validate` command"""
+
+    ERROR = "error"
+    WARNING = "warning"
+    INFO = "info"
+
+
+CHECKS: dict[str, Severity] = {
+    "empty-lyrics": Severity.ERROR,
+    "not-synced": Severity.ERROR,
+    "mixed-sync": Severity.ERROR,
+    "equal-timestamps": Severity.ERROR,
+    "non-monotonic": Severity.WARNING,
+    "duplicate-timestamp": Severity.WARNING,
+    "past-length": Severity.WARNING,
+    "invalid-length": Severity.WARNING,
+    "overlong-line": Severity.WARNING,
+    "unknown-tag": Severity.INFO,
+}
+"""the code of every problem found by `validate` and its severity"""
+
+
+@dataclasses.dataclass(frozen=True)
+class Diagnostic:
+    """A problem found by `validate`"""
+
+    line_no: Optional[int]
+    """1 based number of the line, `None` for the file as a whole"""
+    code: str
+    """one of `CHECKS`"""
+    message: str
+    severity: Severity
+
+    def __str__(self) -> str:
+        where = "-" if self.line_no is None else self.line_no
+        return f"{where}: {self.severity.value} {self.code}: {self.message}"
+
+
+@dataclasses.dataclass
+class ValidationResult:
+    """diagnostics of one file of `validate_many`"""
+
+    path: Path
+    diagnostics: list[Diagnostic] = dataclasses.field(default_factory=list)
+    error: Optional[str] = None
+    """why the file could not be read"""
+
+    @property
+    def ok(self) -> bool:
+        """the file was read and has no `ERROR` diagnostic"""
+        return self.error is None and not any(
+            diagnostic.severity is Severity.ERROR
+            for diagnostic in self.diagnostics
+        )
+
+
+def _diagnostic(line_no: int | None, code: str, message: str) -> Diagnostic:
+    return Diagnostic(line_no, code, message, CHECKS[code])
+
+
+def _iter_diagnostics(
+    lines: Iterable[str], max_line_length: int
+) -> Iterator[Diagnostic]:
+    # pylint: disable=too-many-locals,too-many-branches,too-many-statements
+    # file level findings, reported once the last line is read
+    has_text = False
+    synced_line: int | None = None
+    unsynced_line: int | None = None
+    # empty lines only count as lines without timestamp if a line follows,
+    # trailing ones are dropped when loading. Blank lines read from a file
+    # still have their line end, they are kept as the lines are not empty
+    pending_blank: int | None = None
+    first_timestamp: int | None = None
+    all_equal = True
+    timed = 0
+
+    previous = -1
+    previous_line = 0
+    seen: dict[int, int] = {}
+    length: int | None = None
+    length_tag = ""
+    # timestamps read before the `length` tag, it may come last
+    before_length: list[tuple[int, int]] = []
+
+    for line_no, line in enumerate(lines, 1):
+        parsed = SyncedLyrics.parse_str(line)
+
+        if isinstance(parsed, dict):
+            for key, value in parsed.items():
+                if key not in LRCMetadata.FIELD_BY_KEY:
+                    yield _diagnostic(
+                        line_no, "unknown-tag", f"unknown tag [{key}]"
+                    )
+                elif LRCMetadata.FIELD_BY_KEY[key] == "length":
+                    length, length_tag = parse_length(value), value
+                    if length is None:
+                        yield _diagnostic(
+                            line_no,
+                            "invalid-length",
+                            f"length {value!r} is not mm:ss",
+                        )
+                        continue
+                    yield from (
+                        _past_length(timed_line, earlier, value)
+                        for timed_line, earlier in before_length
+                        if earlier > length
+                    )
+                    before_length.clear()
+            continue
+
+        parsed_lines: list[SyncedLyricLine] = (
+            parsed if isinstance(parsed, list) else [parsed]
+        )
+        text = parsed_lines[0].text
+        first = parsed_lines[0].timestamp
+
+        if first is None and not line:
+            if pending_blank is None:
+                pending_blank = line_no
+            continue
+        if pending_blank is not None and unsynced_line is None:
+            unsynced_line = pending_blank
+        pending_blank = None
+
+        has_text = has_text or bool(text)
+        if len(text) > max_line_length:
+            yield _diagnostic(
+                line_no,
+                "overlong-line",
+                f"{len(text)} characters, more than {max_line_length}",
+            )
+
+        if first is None:
+            if unsynced_line is None:
+                unsynced_line = line_no
+            continue
+        if synced_line is None:
+            synced_line = line_no
+
+        # extra timestamps of a line repeat it later, only the first one
+        # has to follow the line before
+        if first < previous:
+            yield _diagnostic(
+                line_no,
+                "non-monotonic",
+                f"{format_timestamp(first)} is before"
+                f" {format_timestamp(previous)} on line {previous_line},"
+                " the lines are sorted when loading",
+            )
+        previous, previous_line = first, line_no
+
+        for parsed_line in parsed_lines:
+            timestamp: int = parsed_line.timestamp  # type: ignore[assignment]
+            timed += 1
+            if first_timestamp is None:
+                first_timestamp = timestamp
+            elif timestamp != first_timestamp:
+                all_equal = False
+
+            if timestamp in seen:
+                yield _diagnostic(
+                    line_no,
+                    "duplicate-timestamp",
+                    f"{format_timestamp(timestamp)} is also on line"
+                    f" {seen[timestamp]}",
+                )
+            else:
+                seen[timestamp] = line_no
+
+            if length is None:
+                before_length.append((line_no, timestamp))
+            elif timestamp > length:
+                yield _past_length(line_no, timestamp, length_tag)
+
+    if not has_text:
+        yield _diagnostic(None, "empty-lyrics", "there are no lyrics")
+    elif synced_line is None:
+        yield _diagnostic(None, "not-synced", "no line has a timestamp")
+    elif unsynced_line is not None:
+        yield _diagnostic(
+            unsynced_line,
+            "mixed-sync",
+            f"no timestamp while line {synced_line} has one, the lyrics are"
+            " not synced when loading",
+        )
+    elif all_equal and timed > 1:
+        yield _diagnostic(
+            synced_line,
+            "equal-timestamps",
+            "all the timestamps are the same, they are removed when loading",
+        )
+
+
+def _past_length(line_no: int, timestamp: int, length: str) -> Diagnostic:
+    return _diagnostic(
+        line_no,
+        "past-length",
+        f"{format_timestamp(timestamp)} is past the length {length}",
+    )
+
+
+def validate(
+    path_or_lines: Path | str | Iterable[str],
+    max_line_length: int = MAX_LINE_LENGTH,
+) -> list[Diagnostic]:
+    """find the problems of a lyric file in one pass over its lines
+
+    `path_or_lines`: path of the file, or its lines
+    `max_line_length`: see `MAX_LINE_LENGTH`
+
+    Lines are parsed as in `SyncedLyrics.load_from_lines`, one at a time,
+    so the text of a file is never held in memory. Diagnostics of single
+    lines are in line order, the ones about the whole file come last. See
+    `CHECKS` for what is reported.
+    """
+    if isinstance(path_or_lines, (Path, str)):
+        path = SyncedLyrics._resolve_path(  # pylint: disable=protected-access
+            path_or_lines
+        )
+        with open(path, "r", encoding="utf-8") as file:
+            return list(_iter_diagnostics(file, max_line_length))
+    return list(_iter_diagnostics(path_or_lines, max_line_length))
+
+
+def _validate_file(path: Path, max_line_length: int) -> ValidationResult:
+    """`validate` for `validate_many`, errors are returned with the path"""
+    try:
+        return ValidationResult(path, validate(path, max_line_length))
+    except (OSError, UnicodeDecodeError, FileTypeError) as exc:
+        return ValidationResult(path, error=f"{type(exc).__name__}: {exc}")
+
+
+def validate_many(
+    paths: Iterable[Path | str],
+    workers: int | None = None,
+    max_line_length: int = MAX_LINE_LENGTH,
+) -> Iterator[ValidationResult]:
+    """`validate` many files using a pool of processes
+
+    `paths`: paths of the files, read lazily
+    `workers`: number of processes, defaults to the number of CPUs. With
+        one the files are validated in this process
+    `max_line_length`: see `validate`
+
+    yields a `ValidationResult` per path in the same order as `paths`, a
+    file which can not be read does not stop the others
+    """
+    func = functools.partial(_validate_file, max_line_length=max_line_length)
+    files = map(Path, paths)
+    workers = workers or os.cpu_count() or 1
+    if workers <= 1:
+        yield from map(func, files)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from imap_bounded(executor, func, files, max_pending=workers * 4)
@@ -0,0 +1,142 @@
+import subprocess
+import sys
+
+import pytest
+
+from lrctoolbox import alignment
+from lrctoolbox.alignment import nearest_function
+from lrctoolbox.synced_lyric_line import SyncedLyricLine
+from lrctoolbox.synced_lyrics import SyncedLyrics
+
+
+@pytest.fixture
+def lyrics() -> SyncedLyrics:
+    return SyncedLyrics.load_from_lines(
+        [
+            "[ar:Foo]",
+            "[00:01.00]One",
+            "[00:02.00]Two",
+            "not synced",
+            "[00:03.00]Three",
+            "[00:10.00]Four",
+        ]
+    )
+
+
+@pytest.mark.parametrize("backend", ["numpy", "bisect"])
+def test_nearest_function(backend: str, monkeypatch: pytest.MonkeyPatch):
+    numpy = pytest.importorskip("numpy") if backend == "numpy" else None
+    monkeypatch.setattr(alignment, "_numpy", lambda: numpy)
+    nearest = nearest_function([0.0, 100.0, 250.0])
+    assert nearest([-10, 0, 49, 50, 51, 180, 1000]) == [
+        0.0,
+        0.0,
+        0.0,
+        0.0,
+        100.0,
+        250.0,
+        250.0,
+    ]
+    assert nearest_function([5.0])([1, 9]) == [5.0, 5.0]
+
+
+def test_numpy_is_imported_lazily():
+    code = "import sys, lrctoolbox; print('numpy' in sys.modules)"
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    assert result.stdout.strip() == "False"
+
+
+def test_align_nearest(lyrics: SyncedLyrics):
+    aligned, report = lyrics.align_to(
+        [1050, 1900, 3010, 4000], max_shift_ms=200
+    )
+    assert list(map(str, aligned)) == [
+        "[00:01.05]One",
+        "[00:01.90]Two",
+        "not synced",
+        "[00:03.01]Three",
+        "[00:10.00]Four",
+    ]
+    assert report.residuals == [-50, 100, None, -10, None]
+    assert (report.matched, report.unmatched) == (3, 1)
+    assert report.mean_abs_error == pytest.approx(160 / 3)
+    assert report.max_abs_error == 100
+    # the original is left as it is
+    assert lyrics.synced_lines[0] == SyncedLyricLine("One", 1000)
+    assert aligned.artist == "Foo"
+
+
+def test_align_linear_fit(lyrics: SyncedLyrics):
+    reference = [1.02 * time + 300 for time in (1000, 2000, 3000, 10000)]
+    # an onset with no line, far from the others
+    reference.append(6000)
+    aligned, report = lyrics.align_to(
+        reference, max_shift_ms=500, method="linear_fit"
+    )
+    assert report.scale == pytest.approx(1.02)
+    assert report.offset_ms == pytest.approx(300)
+    assert report.max_abs_error == pytest.approx(0, abs=1e-6)
+    assert [line.timestamp for line in aligned] == [
+        1320,
+        2340,
+        None,
+        3360,
+        10500,
+    ]
+
+
+def test_align_dtw_is_one_to_one():
+    lyrics = SyncedLyrics.load_from_lines(
+        ["[00:01.00]One", "[00:01.10]Two", "[00:05.00]Three"]
+    )
+    reference = [900, 1500, 5000]
+    nearest, _ = lyrics.align_to(reference, method="nearest")
+    assert [line.timestamp for line in nearest] == [900, 900, 5000]
+    aligned, report = lyrics.align_to(
+        reference, max_shift_ms=1000, method="dtw"
+    )
+    assert [line.timestamp for line in aligned] == [900, 1500, 5000]
+    assert report.residuals == [100, -400, 0]
+
+
+def test_align_dtw_leaves_far_lines():
+    lyrics = SyncedLyrics.load_from_lines(
+        ["[00:01.00]One", "[00:02.00]Two", "[00:30.00]Far"]
+    )
+    aligned, report = lyrics.align_to(
+        [1100, 2100], max_shift_ms=500, method="dtw"
+    )
+    assert [line.timestamp for line in aligned] == [1100, 2100, 30000]
+    assert report.unmatched == 1
+
+
+def test_align_keeps_lines_without_timestamp_in_place():
+    lyrics = SyncedLyrics.load_from_lines(
+        ["[00:01.00]One", "after one", "[00:02.00]Two", "[00:03.00]Three"]
+    )
+    aligned, report = lyrics.align_to([1200, 1900], max_shift_ms=300)
+    assert list(map(str, aligned)) == [
+        "[00:01.20]One",
+        "after one",
+        "[00:01.90]Two",
+        "[00:03.00]Three",
+    ]
+    assert report.residuals == [-200, None, 100, None]
+
+
+@pytest.mark.parametrize(
+    "lines, reference, method",
+    [
+        (["[00:01.00]One", "[00:02.00]Two"], [], "nearest"),
+        (["[00:01.00]One", "[00:02.00]Two"], [1000], "magic"),
+        (["One", "Two"], [1000], "nearest"),
+    ],
+)
+def test_align_errors(lines, reference, method):
+    with pytest.raises(ValueError):
+        SyncedLyrics.load_from_lines(lines).align_to(reference, method=method)
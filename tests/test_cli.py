@@ -0,0 +1,109 @@
+from pathlib import Path
+
+import pytest
+
+from lrctoolbox import SyncedLyrics
+from lrctoolbox.cli import main
+
+
+@pytest.fixture
+def lyrics_dir(tmp_path: Path, lines_with_metadata_wrapped) -> Path:
+    for name in ("a.lrc", "nested/b.lrc", "c.txt", "ignored.md"):
+        path = tmp_path / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(
+            "\n".join(lines_with_metadata_wrapped), encoding="utf-8"
+        )
+    return tmp_path
+
+
+@pytest.mark.parametrize("jobs", ["1", "2"])
+def test_shift(lyrics_dir: Path, jobs):
+    assert main(["shift", "--ms", "1000", "-j", jobs, str(lyrics_dir)]) == 0
+    for name in ("a.lrc", "nested/b.lrc", "c.txt"):
+        lyrics = SyncedLyrics.load_from_file(lyrics_dir / name)
+        assert lyrics.synced_lines[0].timestamp == 1000
+
+
+@pytest.mark.parametrize(
+    "args", [["shift", "--ms", "500"], ["normalize"], ["convert"]]
+)
+def test_not_synced_files_are_not_rewritten(tmp_path: Path, capsys, args):
+    text = "[ar:X]\n[00:01.00]one\n\n[00:02.00]two"
+    path = tmp_path / "blank.txt"
+    path.write_text(text, encoding="utf-8")
+    assert main(args + [str(path)]) == 1
+    _, err = capsys.readouterr()
+    assert f"FAILED {path}: ValueError" in err
+    assert path.read_text(encoding="utf-8") == text
+    assert not path.with_suffix(".lrc").exists()
+    # no temporary file is left behind
+    assert list(tmp_path.iterdir()) == [path]
+
+
+def test_rewrite_is_atomic(lyrics_dir: Path, monkeypatch):
+    path = lyrics_dir / "a.lrc"
+    text = path.read_text(encoding="utf-8")
+
+    def crash(*args, **kwargs):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(SyncedLyrics, "write_to", crash)
+    assert main(["shift", "--ms", "500", str(path)]) == 1
+    assert path.read_text(encoding="utf-8") == text
+    assert sorted(p.name for p in path.parent.iterdir()) == [
+        "a.lrc",
+        "c.txt",
+        "ignored.md",
+        "nested",
+    ]
+
+
+def test_normalize_collapse(lyrics_dir: Path, only_lyrics_wrapped):
+    args = ["normalize", "--collapse", "--no-metadata", str(lyrics_dir)]
+    assert main(args) == 0
+    text = (lyrics_dir / "a.lrc").read_text(encoding="utf-8")
+    assert text.splitlines() == only_lyrics_wrapped
+
+
+def test_convert(lyrics_dir: Path):
+    assert main(["convert", str(lyrics_dir)]) == 0
+    assert (lyrics_dir / "c.lrc").exists()
+    # existing files are failures unless --overwrite is given
+    assert main(["convert", str(lyrics_dir)]) == 1
+    assert main(["convert", "--overwrite", str(lyrics_dir)]) == 0
+
+
+def test_stats(lyrics_dir: Path, capsys):
+    assert main(["stats", str(lyrics_dir / "a.lrc")]) == 0
+    out, err = capsys.readouterr()
+    assert out.strip() == f"{lyrics_dir / 'a.lrc'}\t4\tTrue"
+    assert "processed 1 files" in err
+
+
+def test_validate_failure(lyrics_dir: Path, capsys):
+    bad = lyrics_dir / "bad.lrc"
+    bad.write_text("just text\nmore text", encoding="utf-8")
+    assert main(["validate", str(lyrics_dir)]) == 1
+    _, err = capsys.readouterr()
+    assert f"FAILED {bad}" in err
+
+
+def test_validate_warnings(lyrics_dir: Path, capsys):
+    path = lyrics_dir / "a.lrc"
+    path.write_text("[00:02.00]One\n[00:01.00]Two", encoding="utf-8")
+    assert main(["validate", str(path)]) == 0
+    out, _ = capsys.readouterr()
+    assert out.startswith(f"{path}:2: warning non-monotonic:")
+
+
+def test_manifest_resume(lyrics_dir: Path, capsys):
+    manifest = lyrics_dir / "manifest.txt"
+    args = ["shift", "--ms", "1000", "--manifest", str(manifest)]
+    assert main(args + [str(lyrics_dir / "a.lrc")]) == 0
+    assert main(args + [str(lyrics_dir)]) == 0
+    _, err = capsys.readouterr()
+    assert "1 skipped from manifest" in err
+    # the file recorded in the manifest was shifted only once
+    lyrics = SyncedLyrics.load_from_file(lyrics_dir / "a.lrc")
+    assert lyrics.synced_lines[0].timestamp == 1000
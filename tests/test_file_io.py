@@ -0,0 +1,48 @@
+import io
+from pathlib import Path
+
+import pytest
+
+from lrctoolbox.exceptions import FileTypeError
+from lrctoolbox.file_io import atomic_file, check_save_path, is_binary
+
+
+def test_atomic_file(tmp_path: Path):
+    path = tmp_path / "song.lrc"
+    path.write_text("old", encoding="utf-8")
+    with atomic_file(path) as file:
+        file.write("new")
+        # the destination is only replaced once the file is written
+        assert path.read_text(encoding="utf-8") == "old"
+    assert path.read_text(encoding="utf-8") == "new"
+    assert list(tmp_path.iterdir()) == [path]
+
+
+def test_atomic_file_error(tmp_path: Path):
+    path = tmp_path / "song.lrc"
+    path.write_text("old", encoding="utf-8")
+    with pytest.raises(RuntimeError):
+        with atomic_file(path, fsync=True) as file:
+            file.write("new")
+            raise RuntimeError
+    assert path.read_text(encoding="utf-8") == "old"
+    assert list(tmp_path.iterdir()) == [path]
+
+
+def test_check_save_path(tmp_path: Path):
+    path = tmp_path / "song.lrc"
+    check_save_path(path, [".lrc"], overwrite=False)
+    with pytest.raises(FileTypeError):
+        check_save_path(path.with_suffix(".srt"), [".lrc"], overwrite=False)
+    path.touch()
+    with pytest.raises(FileExistsError):
+        check_save_path(path, [".lrc"], overwrite=False)
+    check_save_path(path, [".lrc"], overwrite=True)
+
+
+@pytest.mark.parametrize(
+    "fileobj, expected",
+    [(io.StringIO(), False), (io.BytesIO(), True)],
+)
+def test_is_binary(fileobj, expected):
+    assert is_binary(fileobj) is expected
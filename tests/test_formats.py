@@ -0,0 +1,128 @@
+import io
+
+import pytest
+
+from lrctoolbox.exceptions import FormatError
+from lrctoolbox.formats import parse_length
+from lrctoolbox.synced_lyric_line import SyncedLyricLine
+from lrctoolbox.synced_lyrics import SyncedLyrics
+
+
+@pytest.fixture
+def lyrics_with_gap() -> SyncedLyrics:
+    lyrics = SyncedLyrics.load_from_lines(
+        [
+            "[length:00:20]",
+            "[00:01.00]Foo bar",
+            "[00:04.50]",
+            "[00:05.00]Baz qux",
+            "[00:10.00]Quux quuz",
+        ]
+    )
+    return lyrics
+
+
+def export(lyrics: SyncedLyrics, fmt: str) -> str:
+    fileobj = io.StringIO()
+    lyrics.export(fmt, fileobj)
+    return fileobj.getvalue()
+
+
+@pytest.mark.parametrize(
+    "length, expected",
+    [
+        ("200", 200000),
+        ("215", 215000),
+        ("215.0", 215000),
+        ("3", 3000),
+        ("4:45", 285000),
+        ("03:20.5", 200500),
+        ("03:20.25", 200250),
+        ("3.5", 3500),
+        ("01:02:03", None),
+        ("", None),
+        ("unknown", None),
+    ],
+)
+def test_parse_length(length, expected):
+    assert parse_length(length) == expected
+
+
+def test_export_srt(lyrics_with_gap: SyncedLyrics):
+    assert export(lyrics_with_gap, "srt") == (
+        "1\n00:00:01,000 --> 00:00:04,500\nFoo bar\n\n"
+        "2\n00:00:05,000 --> 00:00:10,000\nBaz qux\n\n"
+        "3\n00:00:10,000 --> 00:00:20,000\nQuux quuz\n\n"
+    )
+
+
+def test_export_vtt(lyrics_with_gap: SyncedLyrics):
+    lyrics_with_gap.length = None
+    assert export(lyrics_with_gap, "vtt") == (
+        "WEBVTT\n\n"
+        "00:00:01.000 --> 00:00:04.500\nFoo bar\n\n"
+        "00:00:05.000 --> 00:00:10.000\nBaz qux\n\n"
+        "00:00:10.000 --> 00:00:15.000\nQuux quuz\n\n"
+    )
+
+
+def test_export_lrc(sample_synced_lyrics: SyncedLyrics):
+    expected = "\n".join(
+        sample_synced_lyrics.lrc_formatted_metadata
+        + sample_synced_lyrics.lyrics
+    )
+    assert export(sample_synced_lyrics, "lrc") == expected
+
+
+@pytest.mark.parametrize(
+    "lines",
+    [
+        ["[ar:Foo]", "[00:01.00]Foo", "[00:02.00]Bar"],
+        ["[ar:Foo]", "[00:01.00]Foo", "not synced"],
+    ],
+)
+def test_export_lrc_is_save_to_file(lines, tmp_path):
+    lyrics = SyncedLyrics.load_from_lines(lines)
+    lyrics.save_to_file(tmp_path / "lyrics.lrc")
+    saved = (tmp_path / "lyrics.lrc").read_text(encoding="utf-8")
+    assert export(lyrics, "lrc") == saved
+
+
+@pytest.mark.parametrize("fmt", ["srt", "vtt"])
+def test_subtitles_round_trip(lyrics_with_gap: SyncedLyrics, fmt):
+    loaded = SyncedLyrics.load_from_stream(
+        io.StringIO(export(lyrics_with_gap, fmt)), fmt
+    )
+    assert loaded.synced_lines == lyrics_with_gap.synced_lines
+
+
+@pytest.mark.parametrize("fmt", ["lrc", "jsonl"])
+def test_round_trip(sample_synced_lyrics: SyncedLyrics, fmt, metadata):
+    loaded = SyncedLyrics.load_from_stream(
+        io.StringIO(export(sample_synced_lyrics, fmt)), fmt
+    )
+    assert loaded.synced_lines == sample_synced_lyrics.synced_lines
+    for key, value in metadata.items():
+        assert getattr(loaded, key) == value
+
+
+def test_load_vtt_with_identifiers_and_notes():
+    vtt = (
+        "WEBVTT - lyrics\n\n"
+        "NOTE this is a comment\n\n"
+        "intro\n00:01.000 --> 00:02.000 align:start\nFoo\nbar\n\n"
+        "01:00:00.000 --> 01:00:01.000\nBaz"
+    )
+    loaded = SyncedLyrics.load_from_stream(io.StringIO(vtt), "vtt")
+    assert loaded.synced_lines == [
+        SyncedLyricLine("Foo bar", 1000),
+        SyncedLyricLine("", 2000),
+        SyncedLyricLine("Baz", 3600000),
+    ]
+
+
+def test_unsupported_format(sample_synced_lyrics: SyncedLyrics):
+    with pytest.raises(FormatError):
+        sample_synced_lyrics.export("ass", io.StringIO())
+    with pytest.raises(FormatError):
+        SyncedLyrics.load_from_stream(io.StringIO(), "ass")
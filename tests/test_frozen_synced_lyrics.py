@@ -0,0 +1,68 @@
+import dataclasses
+import pickle
+
+import pytest
+
+from lrctoolbox.frozen_synced_lyrics import (
+    FrozenSyncedLyricLine,
+    FrozenSyncedLyrics,
+)
+from lrctoolbox.synced_lyrics import SyncedLyrics
+
+
+def test_freeze(sample_synced_lyrics: SyncedLyrics, metadata):
+    frozen = sample_synced_lyrics.freeze()
+    assert frozen.lyrics == tuple(sample_synced_lyrics.lyrics)
+    assert str(frozen) == str(sample_synced_lyrics)
+    assert len(frozen) == len(sample_synced_lyrics.synced_lines)
+    assert list(frozen)[0] == FrozenSyncedLyricLine("Foo bar", 0)
+    assert frozen.is_synced
+    assert frozen.has_timestamps_in_ascending_order
+    assert not frozen.has_timestamps_all_equal
+    assert not frozen.is_missing_any_timestamp
+    for key, value in metadata.items():
+        assert getattr(frozen, key) == value
+    assert frozen.language is None
+    with pytest.raises(AttributeError):
+        frozen.foo  # pylint: disable=pointless-statement
+
+
+def test_frozen_is_immutable(sample_synced_lyrics: SyncedLyrics):
+    frozen = sample_synced_lyrics.freeze()
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        frozen.lines[0].timestamp = 1000  # type: ignore[misc]
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        frozen.artist = "Foo"  # type: ignore[misc]
+    # changing the original does not change the snapshot
+    sample_synced_lyrics.synced_lines[0].timestamp = 1000
+    sample_synced_lyrics.artist = "Foo"
+    assert frozen.lines[0].timestamp == 0
+    assert frozen.artist != "Foo"
+
+
+def test_frozen_is_hashable(sample_synced_lyrics: SyncedLyrics):
+    frozen = sample_synced_lyrics.freeze()
+    again = sample_synced_lyrics.freeze()
+    assert frozen == again
+    assert len({frozen, again}) == 1
+    sample_synced_lyrics.synced_lines[0].text = "changed"
+    assert sample_synced_lyrics.freeze() != frozen
+
+
+def test_thaw(sample_synced_lyrics: SyncedLyrics):
+    thawed = sample_synced_lyrics.freeze().thaw()
+    assert type(thawed) is SyncedLyrics
+    assert thawed.synced_lines == sample_synced_lyrics.synced_lines
+    assert thawed.to_dict() == sample_synced_lyrics.to_dict()
+    thawed.synced_lines[0].timestamp = 1000
+    assert sample_synced_lyrics.synced_lines[0].timestamp == 0
+
+
+def test_frozen_unsynced_and_pickle():
+    lyrics = SyncedLyrics.load_from_lines(["[00:01.00]Foo", "Bar"])
+    frozen = lyrics.freeze()
+    assert not frozen.is_synced
+    assert frozen.is_missing_any_timestamp
+    assert frozen.lyrics == ("Foo", "Bar")
+    assert pickle.loads(pickle.dumps(frozen)) == frozen
+    assert FrozenSyncedLyrics(()).thaw().synced_lines == []
@@ -0,0 +1,53 @@
+from lrctoolbox.intern_pool import InternPool
+from lrctoolbox.synced_lyrics import SyncedLyrics
+
+
+def fresh(text: str) -> str:
+    """an equal but distinct str object"""
+    return "".join(list(text))
+
+
+def test_intern():
+    pool = InternPool()
+    first = fresh("chorus line")
+    second = fresh("chorus line")
+    assert first is not second
+    assert pool.intern(first) is first
+    assert pool.intern(second) is first
+    assert pool.hits == 1
+    assert pool.misses == 1
+    assert pool.bytes_saved > 0
+    assert "chorus line" in pool
+    assert len(pool) == 1
+
+
+def test_bounded_size_drops_unused_first():
+    pool = InternPool(max_size=10)
+    kept = [pool.intern(fresh(f"kept {i}")) for i in range(5)]
+    for i in range(20):
+        pool.intern(fresh(f"dropped {i}"))
+    assert len(pool) <= 10
+    assert all(text in pool for text in kept)
+
+
+def test_load_from_lines_shares_strings():
+    pool = InternPool()
+    lines = [
+        "[ar:Foo]",
+        "[00:01.00]♪",
+        "[00:02.00][00:04.00]Chorus",
+        "[00:03.00]♪",
+    ]
+    first = SyncedLyrics.load_from_lines(lines, intern_pool=pool)
+    second = SyncedLyrics.load_from_lines(lines, intern_pool=pool)
+    assert first.lyrics == second.lyrics
+    assert first.artist is second.artist
+    texts = [line.text for line in first] + [line.text for line in second]
+    assert len({id(text) for text in texts}) == 2
+
+
+def test_update_metadata():
+    pool = InternPool()
+    first = SyncedLyrics().update_metadata({"ar": fresh("Foo")}, pool)
+    second = SyncedLyrics().update_metadata({"ar": fresh("Foo")}, pool)
+    assert first.artist is second.artist
@@ -0,0 +1,78 @@
+import io
+import zipfile
+from pathlib import Path
+
+import pytest
+
+from lrctoolbox.synced_lyric_line import SyncedLyricLine
+from lrctoolbox.synced_lyrics import SyncedLyrics
+
+
+@pytest.fixture
+def archive(tmp_path: Path, lines_with_metadata_wrapped) -> Path:
+    path = tmp_path / "pack.zip"
+    content = "\n".join(lines_with_metadata_wrapped)
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as zip_file:
+        zip_file.writestr("a.lrc", content)
+        zip_file.writestr("nested/", "")
+        zip_file.writestr("nested/b.txt", "[00:01.00]B")
+        zip_file.writestr("cover.jpg", b"\xff\xd8")
+        zip_file.writestr("nested/c.lrc", "[00:02.00]C\r\n[00:01.00]D\r\n")
+    return path
+
+
+def test_load_from_bytes(
+    sample_synced_lyrics: SyncedLyrics, lines_with_metadata_wrapped
+):
+    data = "\r\n".join(lines_with_metadata_wrapped).encode("utf-8-sig")
+    loaded = SyncedLyrics.load_from_bytes(data)
+    assert loaded.synced_lines == sample_synced_lyrics.synced_lines
+    assert loaded.to_dict() == sample_synced_lyrics.to_dict()
+
+
+def test_load_from_bytes_encoding():
+    data = "[ar:Beyoncé]\n[00:01.00]Déjà vu\n[00:02.00]".encode("latin-1")
+    loaded = SyncedLyrics.load_from_bytes(data, encoding="latin-1")
+    assert loaded.artist == "Beyoncé"
+    assert loaded.lyrics == ["[00:01.00]Déjà vu", "[00:02.00]"]
+
+
+def test_load_from_binary_io_leaves_stream_open():
+    stream = io.BytesIO(b"[00:01.00]Foo\n[00:02.00]Bar")
+    loaded = SyncedLyrics.load_from_binary_io(stream)
+    assert loaded.synced_lines == [
+        SyncedLyricLine("Foo", 1000),
+        SyncedLyricLine("Bar", 2000),
+    ]
+    assert not stream.closed
+
+
+def test_load_empty_bytes():
+    with pytest.raises(ValueError):
+        SyncedLyrics.load_from_bytes(b"")
+    with pytest.raises(ValueError):
+        SyncedLyrics.load_from_binary_io(io.BytesIO())
+
+
+@pytest.mark.parametrize("workers", [None, 2])
+def test_iter_archive(
+    archive: Path, sample_synced_lyrics: SyncedLyrics, workers
+):
+    loaded = dict(SyncedLyrics.iter_archive(archive, workers=workers))
+    assert list(loaded) == ["a.lrc", "nested/b.txt", "nested/c.lrc"]
+    assert loaded["a.lrc"].synced_lines == sample_synced_lyrics.synced_lines
+    assert loaded["nested/c.lrc"].lyrics == ["[00:01.00]D", "[00:02.00]C"]
+
+
+def test_load_content_and_bytes(tmp_path: Path):
+    path = tmp_path / "foo.lrc"
+    path.write_text("[00:01.00]From\n[00:02.00]file")
+    assert SyncedLyrics.load(str(path)).lyrics == [
+        "[00:01.00]From",
+        "[00:02.00]file",
+    ]
+    assert SyncedLyrics.load(str(path), is_content=True).lyrics == [str(path)]
+    assert SyncedLyrics.load(b"Foo\nBar").lyrics == ["Foo", "Bar"]
+    # too long to be a path
+    long_lyrics = "[00:01.00]" + "la " * 5000
+    assert len(SyncedLyrics.load(long_lyrics).synced_lines) == 1
@@ -1,4 +1,9 @@
-from lrctoolbox.lrc_metadata import ModuleMetadata, TrackMetadata
+from pathlib import Path
+
+import pytest
+
+from lrctoolbox.lrc_metadata import LRCMetadata, ModuleMetadata, TrackMetadata
+from lrctoolbox.synced_lyrics import SyncedLyrics
 
 
 def test_track_metadata():
@@ -41,3 +46,58 @@ def test_module_metadata_default_values():
     metadata = ModuleMetadata()
     assert isinstance(metadata.re_name, str)
     assert isinstance(metadata.version, str)
+
+
+def test_from_dict_and_to_dict():
+    metadata = LRCMetadata.from_dict(
+        {"ar": "Adele", "title": "Hello", "offset": "+100"}
+    )
+    assert metadata.artist == "Adele"
+    assert metadata.title == "Hello"
+    assert metadata.extra_tags == {"offset": "+100"}
+    assert metadata.to_dict() == {
+        "artist": "Adele",
+        "title": "Hello",
+        "offset": "+100",
+    }
+    assert metadata.to_dict(by_tag=True) == {
+        "ar": "Adele",
+        "ti": "Hello",
+        "offset": "+100",
+    }
+    assert LRCMetadata.from_dict(metadata.to_dict()) == metadata
+    assert metadata.lrc_formatted_metadata == [
+        "[ar:Adele]",
+        "[ti:Hello]",
+        "[offset:+100]",
+    ]
+
+
+def test_tag_tables():
+    assert LRCMetadata.LRC_TAGS[:2] == ("ar", "ti")
+    assert LRCMetadata.LRC_FIELDS[:2] == ("artist", "title")
+    assert LRCMetadata.FIELD_BY_KEY["ar"] == "artist"
+    assert LRCMetadata.FIELD_BY_KEY["artist"] == "artist"
+    assert "re" not in TrackMetadata.FIELD_BY_KEY
+
+
+@pytest.mark.parametrize(
+    "metadata",
+    [LRCMetadata(), TrackMetadata(), ModuleMetadata(), SyncedLyrics()],
+)
+def test_metadata_is_slotted(metadata):
+    assert not hasattr(metadata, "__dict__")
+    with pytest.raises(AttributeError):
+        metadata.unknown = "foo"
+
+
+def test_unknown_tags_round_trip(tmp_path: Path):
+    lines = ["[ar:Adele]", "[offset:+100]", "[00:01.00]Foo", "[00:02.00]Bar"]
+    lyrics = SyncedLyrics.load_from_lines(lines)
+    assert lyrics.extra_tags == {"offset": "+100"}
+    path = tmp_path / "foo.lrc"
+    lyrics.save_to_file(path)
+    assert "[offset:+100]" in path.read_text().splitlines()
+    assert SyncedLyrics.load_from_file(path).extra_tags == {"offset": "+100"}
+    assert SyncedLyrics.scan_metadata(path).extra_tags == {"offset": "+100"}
+    assert lyrics.copy().extra_tags == {"offset": "+100"}
@@ -0,0 +1,312 @@
+"""Differential tests of every way of loading lyrics.
+
+`reference_load` is a plain copy of what `SyncedLyrics.load_from_lines`
+does, written without any of its optimizations. It is frozen: when the
+parser changes on purpose, change it here too. Every engine in `ENGINES`
+loads the same generated documents and must give the same lines and
+metadata as the reference, and must do it faster than its floor in
+`THROUGHPUT_FLOORS`.
+
+The floors are in lines per second and far below what the engines do on
+a laptop. Set `LRCTOOLBOX_THROUGHPUT_SCALE` to scale them, e.g. `0.2` on
+a slow machine or `0` to skip the throughput tests.
+"""
+
+from __future__ import annotations
+
+import io
+import os
+import pickle
+import random
+import re
+import time
+from typing import Callable
+
+import pytest
+
+from lrctoolbox import SyncedLyrics
+
+Document = tuple[dict[str, str], list[tuple[str, "int | None"]]]
+
+# the patterns of `synced_lyrics`, `.` in the timestamps matches any char
+_LYRICIST = re.compile(r"Lyricist:?\s*(.*)", re.I)
+_SYNCED = re.compile(r"(?P<timestamps>(?:\[\d+:\d+.\d+\])+)(?P<lyrics>.*)")
+_TIMESTAMP = re.compile(r"\[(\d+):(\d+).(\d+)\]")
+_TAG = re.compile(r"\[(\w+):\s?(.*)\]")
+_FIELD_BY_TAG = {
+    "ar": "artist",
+    "ti": "title",
+    "al": "album",
+    "au": "lyricist",
+    "uri": "uri",
+    "mbid": "mbid",
+    "length": "length",
+    "language": "language",
+    "re": "re_name",
+    "ve": "version",
+    "by": "author",
+}
+
+
+def _reference_timestamp(minutes: str, seconds: str, fraction: str) -> int:
+    # up to 3 digits, the digits of the fraction are counted without its
+    # leading zeros, `.05` is 500 ms. More than 3 of them are cut
+    if len(fraction) > 3:
+        value = int(fraction[:3])
+    else:
+        value = int(fraction)
+        value *= 10 ** (3 - len(str(value)))
+    return int(minutes) * 60_000 + int(seconds) * 1000 + value
+
+
+def reference_load(lines: list[str]) -> Document:
+    """metadata and lines of `SyncedLyrics.load_from_lines(lines)`"""
+    lines = [line or "" for line in lines]
+    while lines and not lines[-1]:
+        lines.pop()
+    if not lines:
+        raise TypeError("no lines")
+
+    metadata: dict[str, str] = {}
+    # text, timestamp and the timestamp the line is sorted by
+    parsed: list[tuple[str, int | None, int]] = []
+    sort_by = -1
+    for line in lines:
+        match = _LYRICIST.search(line)
+        if match:
+            metadata["lyricist"] = match.group(1).strip()
+            continue
+        match = _SYNCED.search(line)
+        if match:
+            text = match.group("lyrics").strip()
+            timestamps = [
+                _reference_timestamp(*found.groups())
+                for found in _TIMESTAMP.finditer(match.group("timestamps"))
+            ]
+            # a line without timestamp is sorted after the first timestamp
+            # of the line before it, the other ones are repeats
+            sort_by = timestamps[0]
+            parsed.extend((text, ts, ts) for ts in timestamps)
+            continue
+        match = _TAG.search(line)
+        if match:
+            key, value = match.groups()
+            metadata[_FIELD_BY_TAG.get(key, key)] = value.strip()
+            continue
+        parsed.append((line.strip(), None, sort_by))
+
+    # a stable sort, equal ones stay in written order
+    parsed.sort(key=lambda item: item[2])
+    result = [(text, timestamp) for text, timestamp, _ in parsed]
+    if len({timestamp for _, timestamp in result}) == 1:
+        result = [(text, None) for text, _ in result]
+    return metadata, result
+
+
+def snapshot(lyrics: SyncedLyrics) -> Document:
+    """what the engines are compared on"""
+    return lyrics.to_dict(), [
+        (line.text, line.timestamp) for line in lyrics.synced_lines
+    ]
+
+
+# adversarial documents
+
+
+_TAGS = [*_FIELD_BY_TAG, "artist", "title", "offset", "id", "x_y", "00"]
+_WORDS = [
+    "love",
+    "ça va",
+    "東京",
+    "♪",
+    "(instrumental)",
+    "[not a tag]",
+    "[ar]",
+    "[ti:",
+    "lyricist",
+    "Lyricist:",
+    "[00:01]",
+    "[00:01.]",
+    "[:]",
+    "x]",
+]
+# `strip` removes all of these, none of them ends a line when reading
+_SPACES = [" ", "  ", "\t", "\x0b", "\x0c", "\xa0", " ", "　"]
+_FRACTIONS = ["0", "00", "000", "05", "5", "50", "500", "999", "0001", "12345"]
+
+
+def _timestamp(rng: random.Random, pool: list[str]) -> str:
+    if pool and rng.random() < 0.3:
+        return rng.choice(pool)
+    minutes = rng.choice([0, 0, 1, 3, 9, 59, 60, 99, 100, 71_583])
+    seconds = rng.choice([0, 1, 5, 30, 59, 60, 99])
+    separator = rng.choice("....:,x")
+    fraction = rng.choice(_FRACTIONS)
+    timestamp = f"[{minutes:02d}:{seconds:02d}{separator}{fraction}]"
+    pool.append(timestamp)
+    return timestamp
+
+
+def _text(rng: random.Random) -> str:
+    words = rng.choices(_WORDS + [""] * 4, k=rng.randrange(4))
+    return rng.choice(_SPACES + [""] * 8).join(words)
+
+
+def _line(rng: random.Random, pool: list[str]) -> str:
+    kind = rng.random()
+    if kind < 0.5:
+        count = rng.choice([1, 1, 1, 1, 2, 3])
+        timestamps = "".join(_timestamp(rng, pool) for _ in range(count))
+        return timestamps + rng.choice(["", " "]) + _text(rng)
+    if kind < 0.65:
+        space = rng.choice(["", " ", "  "])
+        return f"[{rng.choice(_TAGS)}:{space}{_text(rng)}]"
+    if kind < 0.7:
+        prefix = rng.choice(["Lyricist: ", "LYRICIST ", "by lyricist"])
+        return prefix + _text(rng)
+    if kind < 0.75:
+        # a timestamp after some text is still found
+        return _text(rng) + " " + _timestamp(rng, pool) + _text(rng)
+    if kind < 0.85:
+        return rng.choice(["", "", *_SPACES])
+    return _text(rng)
+
+
+def make_document(rng: random.Random) -> list[str]:
+    """lines of one document, often sorted, reversed or with all the
+    timestamps equal as those are the special cases of loading"""
+    pool: list[str] = []
+    lines = [_line(rng, pool) for _ in range(rng.randrange(1, 40))]
+    shape = rng.random()
+    if shape < 0.1:
+        timestamp = _timestamp(rng, [])
+        lines = [timestamp + _text(rng) for _ in lines]
+    elif shape < 0.3:
+        lines.sort()
+    elif shape < 0.4:
+        lines.sort(reverse=True)
+    if rng.random() < 0.2:
+        lines.extend([""] * rng.randrange(1, 3))
+    return lines
+
+
+def make_documents(seed: int, count: int = 300) -> list[list[str]]:
+    """`count` documents, the same ones for a given `seed`"""
+    rng = random.Random(seed)
+    return [make_document(rng) for _ in range(count)]
+
+
+# engines
+
+
+def _file_text(lines: list[str]) -> str:
+    return "".join(line + "\n" for line in lines)
+
+
+ENGINES: dict[str, Callable[[list[str]], SyncedLyrics]] = {
+    "load_from_lines": SyncedLyrics.load_from_lines,
+    "load_from_bytes": lambda lines: SyncedLyrics.load_from_bytes(
+        _file_text(lines).encode("utf-8")
+    ),
+    "load_from_binary_io": lambda lines: SyncedLyrics.load_from_binary_io(
+        io.BytesIO(_file_text(lines).encode("utf-8"))
+    ),
+    "load_from_stream": lambda lines: SyncedLyrics.load_from_stream(
+        io.StringIO(_file_text(lines)), "lrc"
+    ),
+    "pickle": lambda lines: pickle.loads(
+        pickle.dumps(SyncedLyrics.load_from_lines(lines))
+    ),
+    "freeze_thaw": lambda lines: (
+        SyncedLyrics.load_from_lines(lines).freeze().thaw()
+    ),
+    "copy": lambda lines: SyncedLyrics.load_from_lines(lines).copy(),
+}
+"""ways of loading the lines of a document"""
+
+KEEPS_LINE_ENDS = {"load_from_bytes", "load_from_binary_io"}
+"""engines which parse the lines of a file with their line ends, so blank
+lines at the end are kept"""
+
+THROUGHPUT_FLOORS: dict[str, float] = {
+    "load_from_lines": 10_000,
+    "load_from_bytes": 10_000,
+    "load_from_binary_io": 10_000,
+    "load_from_stream": 10_000,
+    "pickle": 5_000,
+    "freeze_thaw": 5_000,
+    "copy": 5_000,
+}
+"""minimal lines per second of every engine"""
+
+
+def _expected(name: str, lines: list[str]) -> Document | type[Exception]:
+    if name in KEEPS_LINE_ENDS:
+        lines = [line + "\n" for line in lines]
+    try:
+        return reference_load(lines)
+    except TypeError:
+        return TypeError
+
+
+def test_every_engine_has_a_floor():
+    assert set(THROUGHPUT_FLOORS) == set(ENGINES)
+
+
+def test_reference_on_known_cases():
+    assert reference_load(
+        ["[ar:A]", "[00:02.05][00:00.50]two", "after", "[00:01.00]one", ""]
+    ) == (
+        {"artist": "A"},
+        [("two", 500), ("one", 1000), ("two", 2500), ("after", None)],
+    )
+    assert reference_load(["[00:01.00]a", "[00:01.00]b"]) == (
+        {},
+        [("a", None), ("b", None)],
+    )
+    assert reference_load(["[00:01.1234]my lyricist", "[00:01.1234]b"]) == (
+        {"lyricist": ""},
+        [("b", None)],
+    )
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+@pytest.mark.parametrize("name", list(ENGINES))
+def test_engine_matches_reference(name: str, seed: int):
+    engine = ENGINES[name]
+    for lines in make_documents(seed):
+        expected = _expected(name, lines)
+        if expected is TypeError:
+            with pytest.raises(TypeError):
+                engine(lines)
+            continue
+        lyrics = engine(lines)
+        assert type(lyrics) is SyncedLyrics
+        assert snapshot(lyrics) == expected, lines
+        assert all(
+            line.timestamp is None or type(line.timestamp) is int
+            for line in lyrics.synced_lines
+        ), lines
+
+
+@pytest.mark.parametrize("name", list(ENGINES))
+def test_engine_throughput(name: str):
+    scale = float(os.environ.get("LRCTOOLBOX_THROUGHPUT_SCALE", "1"))
+    if not scale:
+        pytest.skip("LRCTOOLBOX_THROUGHPUT_SCALE is 0")
+    engine = ENGINES[name]
+    documents = [
+        lines
+        for lines in make_documents(seed=100)
+        if _expected(name, lines) is not TypeError
+    ]
+    count = sum(map(len, documents))
+    best = float("inf")
+    for _ in range(3):
+        start = time.perf_counter()
+        for lines in documents:
+            engine(lines)
+        best = min(best, time.perf_counter() - start)
+    rate = count / best
+    floor = THROUGHPUT_FLOORS[name] * scale
+    assert rate >= floor, f"{name}: {rate:.0f} lines/s, floor {floor:.0f}"
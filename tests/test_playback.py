@@ -0,0 +1,170 @@
+import asyncio
+import time
+
+import pytest
+
+from lrctoolbox.playback import PlaybackScheduler
+from lrctoolbox.synced_lyric_line import SyncedLyricLine
+from lrctoolbox.synced_lyrics import SyncedLyrics
+
+
+@pytest.fixture
+def lyrics() -> SyncedLyrics:
+    lyrics = SyncedLyrics()
+    lyrics.synced_lines = [
+        SyncedLyricLine("zero", 0),
+        SyncedLyricLine("one", 50),
+        SyncedLyricLine("two", 100),
+        SyncedLyricLine("three", 150),
+    ]
+    return lyrics
+
+
+class FakeClock:
+    """a clock which only moves when the test moves it"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+async def collect(playback):
+    started = time.monotonic()
+    return [
+        (line.text, (time.monotonic() - started) * 1000)
+        async for line in playback
+    ]
+
+
+async def next_line(playback, timeout: float = 5) -> str:
+    line = await asyncio.wait_for(playback.__anext__(), timeout)
+    return line.text
+
+
+async def not_yet(task: asyncio.Task) -> None:
+    """`task` is still waiting after the scheduler had time to fire"""
+    await asyncio.sleep(0.03)
+    assert not task.done()
+
+
+def test_play_in_time(lyrics: SyncedLyrics):
+    async def scenario():
+        playback = lyrics.play()
+        # on the clock of the playback, so the timer granularity of the
+        # platform does not matter
+        return [(line, playback.position) async for line in playback]
+
+    played = asyncio.run(scenario())
+    assert [line.text for line, _ in played] == ["zero", "one", "two", "three"]
+    for line, position in played:
+        # never early, up to the resolution of the scheduler
+        assert position >= line.timestamp - 1
+
+
+def test_play_from_position_and_rate(lyrics: SyncedLyrics):
+    async def scenario():
+        clock = FakeClock()
+        playback = lyrics.play(clock=clock, position_ms=70, rate=2.0)
+        assert await next_line(playback) == "one"
+        task = asyncio.ensure_future(next_line(playback))
+        await not_yet(task)
+        # 30ms of lyrics at twice the speed
+        clock.now = 0.015
+        assert await task == "two"
+        task = asyncio.ensure_future(next_line(playback))
+        clock.now = 0.035
+        await not_yet(task)
+        clock.now = 0.040
+        assert await task == "three"
+
+    asyncio.run(scenario())
+
+
+def test_seek_and_pause(lyrics: SyncedLyrics):
+    async def scenario():
+        clock = FakeClock()
+        playback = lyrics.play(clock=clock)
+        assert await next_line(playback) == "zero"
+        playback.seek(120)
+        assert await next_line(playback) == "two"
+        playback.pause()
+        clock.now = 0.05
+        assert playback.position == 120
+        task = asyncio.ensure_future(next_line(playback))
+        await not_yet(task)
+        playback.resume()
+        await not_yet(task)
+        clock.now = 0.08
+        assert await task == "three"
+
+    asyncio.run(scenario())
+
+
+def test_sessions_share_one_timer(lyrics: SyncedLyrics):
+    async def scenario():
+        clock = FakeClock()
+        scheduler = PlaybackScheduler(clock)
+        playbacks = [lyrics.play(scheduler=scheduler) for _ in range(500)]
+        tasks = [
+            asyncio.ensure_future(
+                asyncio.wait_for(collect(playback), timeout=5)
+            )
+            for playback in playbacks
+        ]
+        await asyncio.sleep(0.01)
+        assert len(scheduler) == 500
+        clock.now = 1.0
+        results = await asyncio.gather(*tasks)
+        assert all(len(result) == 4 for result in results)
+        assert len(scheduler) == 0
+
+    asyncio.run(scenario())
+
+
+def test_futures_resolved_early_are_dropped():
+    async def scenario():
+        scheduler = PlaybackScheduler()
+        now = scheduler.clock()
+        for _ in range(1000):
+            future = scheduler.wait_until(now + 60)
+            # what a seek does to the wakeup of a session
+            future.set_result(None)
+            await asyncio.sleep(0)
+            assert len(scheduler) == 0
+            assert len(scheduler._heap) <= 1
+        kept = scheduler.wait_until(now + 60)
+        for _ in range(10):
+            scheduler.wait_until(now + 60).cancel()
+        await asyncio.sleep(0)
+        assert len(scheduler) == 1
+        assert len(scheduler._heap) <= 2
+        kept.cancel()
+
+    asyncio.run(scenario())
+
+
+def test_custom_clock(lyrics: SyncedLyrics):
+    async def scenario():
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        # a clock running at half the speed of the loop
+        playback = lyrics.play(clock=lambda: (loop.time() - start) / 2)
+        return await collect(playback)
+
+    played = asyncio.run(scenario())
+    assert played[-1][1] >= 300 - 5
+
+
+def test_clock_of_scheduler(lyrics: SyncedLyrics):
+    clock = FakeClock()
+    scheduler = PlaybackScheduler(clock)
+    assert lyrics.play(clock=clock, scheduler=scheduler).clock is clock
+    with pytest.raises(ValueError):
+        lyrics.play(clock=FakeClock(), scheduler=scheduler)
+
+
+def test_invalid_rate(lyrics: SyncedLyrics):
+    with pytest.raises(ValueError):
+        lyrics.play(rate=0)
@@ -0,0 +1,72 @@
+from pathlib import Path
+
+from lrctoolbox import SyncedLyrics
+from lrctoolbox.lrc_metadata import LRCMetadata
+
+
+def write_lines(path: Path, lines: list[str]) -> Path:
+    path.write_text("\n".join(lines), encoding="utf-8")
+    return path
+
+
+def test_scan_metadata(tmp_path: Path, lines_with_metadata_wrapped, metadata):
+    path = write_lines(tmp_path / "song.lrc", lines_with_metadata_wrapped)
+    scanned = SyncedLyrics.scan_metadata(path)
+    assert isinstance(scanned, LRCMetadata)
+    assert not isinstance(scanned, SyncedLyrics)
+    for key, value in metadata.items():
+        assert getattr(scanned, key) == value
+
+
+def test_scan_metadata_stops_at_lyrics(tmp_path: Path, only_lyrics_wrapped):
+    path = write_lines(
+        tmp_path / "song.lrc",
+        ["[ar:Foo]", ""] + only_lyrics_wrapped + ["[ti:Bar]"],
+    )
+    scanned = SyncedLyrics.scan_metadata(path, full_scan_fallback=False)
+    assert scanned.artist == "Foo"
+    assert scanned.title is None
+
+
+def test_scan_metadata_trailing_tags(tmp_path: Path, only_lyrics_wrapped):
+    path = write_lines(
+        tmp_path / "song.lrc",
+        ["[ti:Song]", "[ar:Foo]"]
+        + only_lyrics_wrapped
+        + ["[length:03:20]", "[ar:Bar]"],
+    )
+    scanned = SyncedLyrics.scan_metadata(path)
+    loaded = SyncedLyrics.load_from_file(path)
+    assert scanned.title == loaded.title == "Song"
+    assert scanned.length == loaded.length == "03:20"
+    # a later tag replaces the one of the header
+    assert scanned.artist == loaded.artist == "Bar"
+
+
+def test_scan_metadata_byte_budget(tmp_path: Path):
+    path = write_lines(tmp_path / "song.lrc", ["[ar:Foo]", "[ti:Bar]"])
+    scanned = SyncedLyrics.scan_metadata(path, max_bytes=1)
+    assert scanned.artist == "Foo"
+    assert scanned.title is None
+
+
+def test_scan_metadata_tags_at_end(tmp_path: Path, only_lyrics_wrapped):
+    path = write_lines(
+        tmp_path / "song.lrc", only_lyrics_wrapped + ["[ar:Foo]"]
+    )
+    assert SyncedLyrics.scan_metadata(path).artist == "Foo"
+    assert (
+        SyncedLyrics.scan_metadata(path, full_scan_fallback=False).artist
+        is None
+    )
+
+
+def test_scan_metadata_many(tmp_path: Path, only_lyrics_wrapped):
+    paths = [
+        write_lines(tmp_path / f"{i}.lrc", [f"[ar:{i}]"] + only_lyrics_wrapped)
+        for i in range(10)
+    ]
+    scanned = SyncedLyrics.scan_metadata_many(paths, workers=4)
+    assert [metadata.artist for metadata in scanned] == [
+        str(i) for i in range(10)
+    ]
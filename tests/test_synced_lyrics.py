@@ -1,8 +1,13 @@
+import gzip
+import io
+import pickle
 import random
+import sys
 from pathlib import Path
 
 import pytest
 
+from lrctoolbox.exceptions import FileTypeError
 from lrctoolbox.lrc_metadata import TrackMetadata
 from lrctoolbox.synced_lyric_line import SyncedLyricLine
 from lrctoolbox.synced_lyrics import (
@@ -263,3 +268,251 @@ def test_saving_to_file_with_metadata(
     assert written_lyrics.title == "overwritten title"
     assert written_lyrics.re_name is not None
     assert written_lyrics.version is not None
+
+
+@pytest.mark.parametrize(
+    "lines, expected",
+    [
+        (
+            [
+                "[00:10.00][01:20.00]Chorus",
+                "[00:20.00]Verse",
+                "[01:20.00]Bridge",
+                "[01:30.00]Outro",
+            ],
+            [
+                "[00:10.00]Chorus",
+                "[00:20.00]Verse",
+                "[01:20.00]Chorus",
+                "[01:20.00]Bridge",
+                "[01:30.00]Outro",
+            ],
+        ),
+        (
+            [
+                "[00:05.00]Verse",
+                "[00:20.00][00:01.00][00:10.00]Chorus",
+                "[00:15.00]Bridge",
+            ],
+            [
+                "[00:01.00]Chorus",
+                "[00:05.00]Verse",
+                "[00:10.00]Chorus",
+                "[00:15.00]Bridge",
+                "[00:20.00]Chorus",
+            ],
+        ),
+        (
+            ["[00:02.5000]Two", "[00:01.1234][00:03.00]One"],
+            ["[00:01.12]One", "[00:02.50]Two", "[00:03.00]One"],
+        ),
+    ],
+)
+def test_load_multi_timestamp_order(lines, expected):
+    synced_lyrics = SyncedLyrics.load_from_lines(lines)
+    assert synced_lyrics.lyrics == expected
+
+
+@pytest.mark.parametrize(
+    "timestamps, expected",
+    [
+        ("[00:01.5]", [1500]),
+        ("[00:01.05]", [1500]),
+        ("[00:01.1234]", [1123]),
+        ("[00:01.0001]", [1000]),
+        ("[00:01.0999][01:00.12345]", [1099, 60123]),
+    ],
+)
+def test_parse_timestamps(timestamps, expected):
+    assert list(parse_timestamps(timestamps)) == expected
+
+
+def test_load_keeps_lines_without_timestamp_in_place():
+    synced_lyrics = SyncedLyrics.load_from_lines(
+        [
+            "[00:05.00]Foo bar",
+            "no timestamp",
+            "[00:01.00]Baz qux",
+            "[00:10.00]Quux quuz",
+        ]
+    )
+    assert synced_lyrics.synced_lines == [
+        SyncedLyricLine(text="Baz qux", timestamp=1000),
+        SyncedLyricLine(text="Foo bar", timestamp=5000),
+        SyncedLyricLine(text="no timestamp"),
+        SyncedLyricLine(text="Quux quuz", timestamp=10000),
+    ]
+
+
+def test_memory_usage(sample_synced_lyrics: SyncedLyrics):
+    deep = sample_synced_lyrics.memory_usage()
+    shallow = sample_synced_lyrics.memory_usage(deep=False)
+    assert set(deep) == {"lines", "text", "metadata", "total"}
+    assert deep["total"] == deep["lines"] + deep["text"] + deep["metadata"]
+    assert shallow["text"] == 0
+    assert 0 < shallow["lines"] <= deep["lines"]
+    assert 0 < shallow["metadata"] < deep["metadata"]
+
+
+def test_memory_usage_counts_shared_text_once():
+    synced_lyrics = SyncedLyrics.load_from_lines(
+        ["[00:00.00][00:05.00][00:10.00]" + "chorus " * 100]
+    )
+    text = synced_lyrics.synced_lines[0].text
+    for line in synced_lyrics:
+        line.text = text
+    assert synced_lyrics.memory_usage()["text"] == sys.getsizeof(text)
+
+
+def test_save_many(tmp_path: Path, sample_synced_lyrics: SyncedLyrics):
+    existing = tmp_path / "existing.lrc"
+    existing.write_text("untouched")
+    items = [
+        (sample_synced_lyrics, tmp_path / f"dir{i % 3}" / f"{i}.lrc")
+        for i in range(20)
+    ]
+    items += [
+        (sample_synced_lyrics, existing),
+        (sample_synced_lyrics, tmp_path / "unsupported.srt"),
+    ]
+    results = SyncedLyrics.save_many(items, workers=4)
+
+    assert [result.path for result in results] == [
+        Path(path) for _, path in items
+    ]
+    assert all(result.ok for result in results[:20])
+    assert isinstance(results[20].error, FileExistsError)
+    assert isinstance(results[21].error, FileTypeError)
+    assert existing.read_text() == "untouched"
+    expected = tmp_path / "expected.lrc"
+    sample_synced_lyrics.save_to_file(expected)
+    for _, path in items[:20]:
+        assert path.read_text() == expected.read_text()
+    # no temporary file is left behind
+    assert not list(tmp_path.rglob("*.tmp"))
+
+
+def test_save_many_overwrite(
+    tmp_path: Path, sample_synced_lyrics: SyncedLyrics
+):
+    path = tmp_path / "example.lrc"
+    path.write_text("old")
+    (result,) = SyncedLyrics.save_many(
+        [(sample_synced_lyrics, path)],
+        overwrite=True,
+        fsync=True,
+        write_metadata=False,
+    )
+    assert result.ok
+    assert path.read_text() == "\n".join(sample_synced_lyrics.lyrics)
+
+
+@pytest.mark.parametrize(
+    "lines",
+    [
+        ["plain", "", "text ♪"],
+        ["[ar:Foo]", "[00:01.00]Foo", "not synced", "[00:02.00]", "[00:03]"],
+        [
+            "[ar:Foo]",
+            "[offset:+5]",
+            "[00:01.00]Foo",
+            "not synced",
+            "[00:02.00]",
+        ],
+        ["[99999:00.00]after the 32 bit limit", "[00:00.00]" + "x" * 70_000],
+    ],
+)
+def test_pickle_round_trip(lines):
+    synced_lyrics = SyncedLyrics.load_from_lines(lines)
+    unpickled = pickle.loads(pickle.dumps(synced_lyrics))
+    assert type(unpickled) is SyncedLyrics
+    assert unpickled.synced_lines == synced_lyrics.synced_lines
+    assert unpickled.to_dict() == synced_lyrics.to_dict()
+
+
+def test_pickle_negative_timestamps():
+    synced_lyrics = SyncedLyrics.load_from_lines(
+        ["[00:01.00]Foo", "not synced", "[00:02.00]Bar"]
+    )
+    # e.g. shifted back by more than the first timestamp
+    for line in synced_lyrics:
+        if line.timestamp is not None:
+            line.timestamp -= 1001
+    unpickled = pickle.loads(pickle.dumps(synced_lyrics))
+    assert [line.timestamp for line in unpickled] == [-1, None, 999]
+
+
+def test_pickle_empty():
+    unpickled = pickle.loads(pickle.dumps(SyncedLyrics()))
+    assert unpickled.to_dict() == SyncedLyrics().to_dict()
+
+
+def test_pickle_is_compact(sample_synced_lyrics: SyncedLyrics):
+    line = SyncedLyricLine("Foo bar", 1000)
+    assert pickle.loads(pickle.dumps(line)) == line
+    assert b"timestamp" not in pickle.dumps(line)
+    data = pickle.dumps(sample_synced_lyrics)
+    assert data.count(b"Foo bar") == 1
+    assert b"language" not in data  # unset metadata is not pickled
+
+
+def test_iter_lrc(sample_synced_lyrics: SyncedLyrics, only_lyrics_unwrapped):
+    lines = sample_synced_lyrics.iter_lrc(write_metadata=False)
+    assert not isinstance(lines, list)
+    assert list(lines) == only_lyrics_unwrapped
+    with_metadata = list(sample_synced_lyrics.iter_lrc())
+    assert with_metadata[-4:] == only_lyrics_unwrapped
+    assert "[ar:Pritam, Arijit Singh]" in with_metadata
+    assert str(sample_synced_lyrics) == "\n".join(only_lyrics_unwrapped)
+
+
+def test_write_to_matches_save_to_file(
+    tmp_path: Path, sample_synced_lyrics: SyncedLyrics
+):
+    path = tmp_path / "example.lrc"
+    sample_synced_lyrics.save_to_file(path)
+    expected = path.read_bytes()
+
+    text = io.StringIO()
+    sample_synced_lyrics.write_to(text)
+    assert text.getvalue().encode() == expected
+
+    binary = io.BytesIO()
+    sample_synced_lyrics.write_to(binary)
+    assert binary.getvalue() == expected
+
+    compressed = io.BytesIO()
+    with gzip.GzipFile(fileobj=compressed, mode="wb") as gzip_file:
+        sample_synced_lyrics.write_to(gzip_file)
+    assert gzip.decompress(compressed.getvalue()) == expected
+
+
+def test_write_to_in_chunks():
+    synced_lyrics = SyncedLyrics.load_from_lines(
+        [f"[00:{i:02d}.00]line {i}" for i in range(50)]
+    )
+    writes: list[str] = []
+
+    class Recorder(io.StringIO):
+        def write(self, text):
+            writes.append(text)
+            return super().write(text)
+
+    synced_lyrics.write_to(Recorder(), buffer_size=100, write_metadata=False)
+    assert "".join(writes) == str(synced_lyrics)
+    assert len(writes) > 5
+    assert all(len(chunk) < 200 for chunk in writes)
+
+
+def test_copy_keeps_timestamps_of_unsynced_lyrics():
+    synced_lyrics = SyncedLyrics.load_from_lines(
+        ["[ar:]", "[offset:+5]", "[00:01.00]one", "", "[00:02.00]two"]
+    )
+    assert not synced_lyrics.is_synced
+    copied = synced_lyrics.copy()
+    assert copied == synced_lyrics
+    assert copied.to_dict() == {"artist": "", "offset": "+5"}
+    assert [line.timestamp for line in copied] == [1000, None, 2000]
+    # the lines are copies, not shared
+    copied.synced_lines[0].timestamp = 0
+    assert synced_lyrics.synced_lines[0].timestamp == 1000
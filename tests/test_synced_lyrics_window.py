@@ -0,0 +1,81 @@
+import pytest
+
+from lrctoolbox.synced_lyric_line import SyncedLyricLine
+from lrctoolbox.synced_lyrics import SyncedLyrics
+
+
+@pytest.fixture
+def lyrics() -> SyncedLyrics:
+    return SyncedLyrics.load_from_lines(
+        [f"[00:{seconds:02d}.00]Line {seconds}" for seconds in range(0, 60, 5)]
+    )
+
+
+def test_window_bounds(lyrics: SyncedLyrics):
+    window = lyrics.window(10000, 20000)
+    assert len(window) == 2
+    assert window.lyrics == ["[00:10.00]Line 10", "[00:15.00]Line 15"]
+    assert list(window) == lyrics.synced_lines[2:4]
+    assert window[0] is lyrics.synced_lines[2]
+    assert window[-1] is lyrics.synced_lines[3]
+    with pytest.raises(IndexError):
+        window[2]  # pylint: disable=pointless-statement
+
+
+def test_window_include_active(lyrics: SyncedLyrics):
+    window = lyrics.window(12000, 20000, include_active=True)
+    assert window.lyrics == ["[00:10.00]Line 10", "[00:15.00]Line 15"]
+    assert lyrics.window(12000, 20000).lyrics == ["[00:15.00]Line 15"]
+
+
+def test_window_is_a_view(lyrics: SyncedLyrics):
+    window = lyrics.window(10000, 20000)
+    lyrics.synced_lines[2].text = "Changed"
+    assert window[0].text == "Changed"
+
+
+@pytest.mark.parametrize(
+    "start, end",
+    [(100000, 200000), (20000, 10000), (-5000, 0)],
+)
+def test_empty_window(lyrics: SyncedLyrics, start, end):
+    window = lyrics.window(start, end)
+    assert len(window) == 0
+    assert not window.lyrics
+    assert str(window) == ""
+
+
+def test_line_at(lyrics: SyncedLyrics):
+    window = lyrics.window(12000, 30000, include_active=True)
+    assert window.line_at(12000) == SyncedLyricLine("Line 10", 10000)
+    assert window.line_at(15000) == SyncedLyricLine("Line 15", 15000)
+    assert window.line_at(29999) == SyncedLyricLine("Line 25", 25000)
+    assert window.line_at(30000) is None
+    assert window.line_at(0) is None
+    assert lyrics.window(12000, 30000).line_at(12000) is None
+
+
+def test_rebase(lyrics: SyncedLyrics):
+    window = lyrics.window(12000, 20000, include_active=True)
+    assert list(window.iter_lrc(rebase=True)) == [
+        "[00:00.00]Line 10",
+        "[00:03.00]Line 15",
+    ]
+
+
+def test_window_with_lines_without_timestamp():
+    lyrics = SyncedLyrics.load_from_lines(
+        ["[00:05.00]a", "b", "[00:10.00]c", "d", "[00:15.00]e"]
+    )
+    assert lyrics.window(0, 6000).lyrics == ["[00:05.00]a", "b"]
+    assert lyrics.window(6000, 12000).lyrics == ["[00:10.00]c", "d"]
+    assert lyrics.window(12000, 20000, include_active=True).lyrics == [
+        "[00:10.00]c",
+        "d",
+        "[00:15.00]e",
+    ]
+    window = lyrics.window(0, 20000)
+    assert len(window) == 5
+    assert window.line_at(7000) is lyrics.synced_lines[0]
+    assert window.line_at(10000) is lyrics.synced_lines[2]
+    assert window.line_at(1000) is None
@@ -0,0 +1,106 @@
+from pathlib import Path
+
+import pytest
+
+from lrctoolbox.synced_lyrics import SyncedLyrics
+from lrctoolbox.validation import (
+    CHECKS,
+    Diagnostic,
+    Severity,
+    validate,
+    validate_many,
+)
+
+
+def codes(diagnostics: list[Diagnostic]) -> list[tuple[int | None, str]]:
+    return [
+        (diagnostic.line_no, diagnostic.code) for diagnostic in diagnostics
+    ]
+
+
+def test_clean(lines_with_metadata_wrapped):
+    assert validate(lines_with_metadata_wrapped) == []
+
+
+def test_line_checks():
+    diagnostics = validate(
+        [
+            "[ar:Foo]",
+            "[offset:+5]",
+            "[00:02.00]One",
+            "[00:01.00][00:02.00]Two",
+            "[00:04.00]" + "x" * 30,
+            "[length:00:03.50]",
+            "",
+        ],
+        max_line_length=20,
+    )
+    assert codes(diagnostics) == [
+        (2, "unknown-tag"),
+        (4, "non-monotonic"),
+        (4, "duplicate-timestamp"),
+        (5, "overlong-line"),
+        (5, "past-length"),
+    ]
+    assert all(d.severity is CHECKS[d.code] for d in diagnostics)
+    assert str(diagnostics[2]) == (
+        "4: warning duplicate-timestamp: [00:02.00] is also on line 3"
+    )
+
+
+@pytest.mark.parametrize(
+    "lines, expected",
+    [
+        (["[ar:Foo]", ""], [(None, "empty-lyrics")]),
+        (["one", "two"], [(None, "not-synced")]),
+        (["[00:01.00]one", "", "[00:02.00]two"], [(2, "mixed-sync")]),
+        (["[00:01.00]one", "two"], [(2, "mixed-sync")]),
+        (
+            ["[00:01.00]one", "[00:01.00]two"],
+            [(2, "duplicate-timestamp"), (1, "equal-timestamps")],
+        ),
+        (["[length:long]", "[00:01.00]one"], [(1, "invalid-length")]),
+        (
+            ["[length:215]", "[01:00.00]one", "[03:40.00]two"],
+            [(3, "past-length")],
+        ),
+    ],
+)
+def test_file_checks(lines, expected):
+    assert codes(validate(lines)) == expected
+
+
+def test_trailing_blank_lines_are_not_unsynced():
+    assert validate(["[00:01.00]one", "[00:02.00]two", "", ""]) == []
+
+
+@pytest.mark.parametrize(
+    "text, synced",
+    [
+        ("[00:01.00]one\n[00:02.00]two\n", True),
+        ("[00:01.00]one\n[00:02.00]two", True),
+        ("[00:01.00]one\n[00:02.00]two\n\n", False),
+        ("[00:01.00]one\n[00:02.00]two\n \n", False),
+    ],
+)
+def test_file_blank_lines_as_loaded(tmp_path: Path, text, synced):
+    path = tmp_path / "lyrics.lrc"
+    path.write_text(text, encoding="utf-8")
+    assert SyncedLyrics.load_from_file(path).is_synced is synced
+    assert ((3, "mixed-sync") not in codes(validate(path))) is synced
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_validate_many(tmp_path: Path, workers):
+    good = tmp_path / "good.lrc"
+    good.write_text("[00:01.00]one\n[00:02.00]two\n", encoding="utf-8")
+    bad = tmp_path / "bad.lrc"
+    bad.write_text("one\ntwo\n", encoding="utf-8")
+    missing = tmp_path / "missing.lrc"
+    results = list(validate_many([good, bad, missing], workers=workers))
+    assert [result.path for result in results] == [good, bad, missing]
+    assert [result.ok for result in results] == [True, False, False]
+    assert results[0].diagnostics == []
+    assert results[1].diagnostics[0].severity is Severity.ERROR
+    assert results[2].error and results[2].error.startswith("FileNotFound")
+    assert validate(good) == validate(str(good)) == []